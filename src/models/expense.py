@@ -24,6 +24,26 @@ class ExpenseCategory(enum.Enum):
     OTHER = "other"
 
 
+# Human-readable category labels (Japanese with English gloss)
+EXPENSE_CATEGORY_LABELS: dict[ExpenseCategory, str] = {
+    ExpenseCategory.RENT: "家賃 (Rent)",
+    ExpenseCategory.UTILITIES: "光熱費 (Utilities)",
+    ExpenseCategory.SUBSCRIPTIONS: "サブスク (Subscriptions)",
+    ExpenseCategory.GROCERIES: "食料品 (Groceries)",
+    ExpenseCategory.TRANSPORTATION: "交通費 (Transportation)",
+    ExpenseCategory.INSURANCE: "保険 (Insurance)",
+    ExpenseCategory.MEDICAL: "医療費 (Medical)",
+    ExpenseCategory.DINING: "外食 (Dining)",
+    ExpenseCategory.ENTERTAINMENT: "娯楽 (Entertainment)",
+    ExpenseCategory.EDUCATION: "教育 (Education)",
+    ExpenseCategory.OFFICE_SUPPLIES: "事務用品 (Office Supplies)",
+    ExpenseCategory.COMMUNICATION: "通信費 (Communication)",
+    ExpenseCategory.TAX_PAYMENT: "税金 (Tax Payment)",
+    ExpenseCategory.PENSION: "年金 (Pension)",
+    ExpenseCategory.OTHER: "その他 (Other)",
+}
+
+
 class PaymentMethod(enum.Enum):
     CASH = "cash"
     BANK_TRANSFER = "bank_transfer"
@@ -61,21 +81,4 @@ class Expense:
     @property
     def category_label(self) -> str:
         """Human-readable category label."""
-        labels = {
-            ExpenseCategory.RENT: "家賃 (Rent)",
-            ExpenseCategory.UTILITIES: "光熱費 (Utilities)",
-            ExpenseCategory.SUBSCRIPTIONS: "サブスク (Subscriptions)",
-            ExpenseCategory.GROCERIES: "食料品 (Groceries)",
-            ExpenseCategory.TRANSPORTATION: "交通費 (Transportation)",
-            ExpenseCategory.INSURANCE: "保険 (Insurance)",
-            ExpenseCategory.MEDICAL: "医療費 (Medical)",
-            ExpenseCategory.DINING: "外食 (Dining)",
-            ExpenseCategory.ENTERTAINMENT: "娯楽 (Entertainment)",
-            ExpenseCategory.EDUCATION: "教育 (Education)",
-            ExpenseCategory.OFFICE_SUPPLIES: "事務用品 (Office Supplies)",
-            ExpenseCategory.COMMUNICATION: "通信費 (Communication)",
-            ExpenseCategory.TAX_PAYMENT: "税金 (Tax Payment)",
-            ExpenseCategory.PENSION: "年金 (Pension)",
-            ExpenseCategory.OTHER: "その他 (Other)",
-        }
-        return labels[self.category]
+        return EXPENSE_CATEGORY_LABELS[self.category]
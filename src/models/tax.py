@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -22,7 +23,17 @@ class TaxSummary:
     gross_income: int
     total_expenses: int
     expense_breakdown: tuple[CategoryBreakdown, ...]
+    # Per-month totals, January first (empty if not collected)
+    monthly_income: tuple[int, ...] = ()
+    monthly_expenses: tuple[int, ...] = ()
 
     @property
     def net_income(self) -> int:
         return self.gross_income - self.total_expenses
+
+    @cached_property
+    def chart_items(self) -> tuple[tuple[str, int], ...]:
+        """(label, total) pairs from expense_breakdown, built once per summary."""
+        return tuple(
+            (item.category_label, item.total) for item in self.expense_breakdown
+        )
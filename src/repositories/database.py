@@ -56,6 +56,19 @@ CREATE TABLE IF NOT EXISTS settings (
 """
 
 
+def period_bounds(year: int, month: int | None = None) -> tuple[str, str]:
+    """Return ISO date bounds [start, end) covering a year or one month.
+
+    Range comparisons on the TEXT date columns can use their indexes,
+    unlike a LIKE 'YYYY-MM%' prefix match.
+    """
+    if month is None:
+        return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+    if month == 12:
+        return f"{year:04d}-12-01", f"{year + 1:04d}-01-01"
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month + 1:02d}-01"
+
+
 def get_connection(db_path: Path | str = DEFAULT_DB_PATH) -> sqlite3.Connection:
     """Open (or create) the database and return a connection.
 
@@ -4,6 +4,7 @@ import sqlite3
 from datetime import date, time
 
 from src.models.event import Event, EventCategory, EventRecurrence
+from src.repositories.database import period_bounds
 
 
 def _parse_time(val: str | None) -> time | None:
@@ -116,12 +117,12 @@ class EventRepository:
         return [_row_to_event(r) for r in rows]
 
     def get_by_month(self, year: int, month: int) -> list[Event]:
-        prefix = f"{year:04d}-{month:02d}"
+        start, end = period_bounds(year, month)
         rows = self._conn.execute(
             """SELECT * FROM events
-               WHERE event_date LIKE ?
+               WHERE event_date >= ? AND event_date < ?
                ORDER BY event_date, start_time""",
-            (prefix + "%",),
+            (start, end),
         ).fetchall()
         return [_row_to_event(r) for r in rows]
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable, Iterator
 from datetime import date
 
 from src.models.expense import (
@@ -9,6 +10,7 @@ from src.models.expense import (
     PaymentMethod,
     RecurrenceType,
 )
+from src.repositories.database import period_bounds
 
 
 def _row_to_expense(row: sqlite3.Row) -> Expense:
@@ -23,6 +25,18 @@ def _row_to_expense(row: sqlite3.Row) -> Expense:
     )
 
 
+def _expense_params(expense: Expense) -> tuple:
+    """Column values in the order used by INSERT and UPDATE."""
+    return (
+        expense.amount,
+        expense.category.value,
+        expense.expense_date.isoformat(),
+        expense.payment_method.value,
+        expense.recurrence.value,
+        expense.notes,
+    )
+
+
 class ExpenseRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self._conn = conn
@@ -32,14 +46,7 @@ class ExpenseRepository:
             """INSERT INTO expenses
                (amount, category, expense_date, payment_method, recurrence, notes)
                VALUES (?, ?, ?, ?, ?, ?)""",
-            (
-                expense.amount,
-                expense.category.value,
-                expense.expense_date.isoformat(),
-                expense.payment_method.value,
-                expense.recurrence.value,
-                expense.notes,
-            ),
+            _expense_params(expense),
         )
         self._conn.commit()
         return Expense(
@@ -52,6 +59,15 @@ class ExpenseRepository:
             notes=expense.notes,
         )
 
+    def insert_many(self, expenses: Iterable[Expense]) -> None:
+        self._conn.executemany(
+            """INSERT INTO expenses
+               (amount, category, expense_date, payment_method, recurrence, notes)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            map(_expense_params, expenses),
+        )
+        self._conn.commit()
+
     def update(self, expense: Expense) -> None:
         if expense.id is None:
             raise ValueError("Cannot update expense without an id")
@@ -60,15 +76,7 @@ class ExpenseRepository:
                SET amount=?, category=?, expense_date=?, payment_method=?,
                    recurrence=?, notes=?
                WHERE id=?""",
-            (
-                expense.amount,
-                expense.category.value,
-                expense.expense_date.isoformat(),
-                expense.payment_method.value,
-                expense.recurrence.value,
-                expense.notes,
-                expense.id,
-            ),
+            (*_expense_params(expense), expense.id),
         )
         self._conn.commit()
 
@@ -92,25 +100,73 @@ class ExpenseRepository:
         return [_row_to_expense(r) for r in rows]
 
     def get_by_month(self, year: int, month: int) -> list[Expense]:
-        prefix = f"{year:04d}-{month:02d}"
+        start, end = period_bounds(year, month)
         rows = self._conn.execute(
             """SELECT * FROM expenses
-               WHERE expense_date LIKE ?
+               WHERE expense_date >= ? AND expense_date < ?
                ORDER BY expense_date DESC""",
-            (prefix + "%",),
+            (start, end),
         ).fetchall()
         return [_row_to_expense(r) for r in rows]
 
     def get_by_year(self, year: int) -> list[Expense]:
-        prefix = f"{year:04d}"
+        start, end = period_bounds(year)
         rows = self._conn.execute(
             """SELECT * FROM expenses
-               WHERE expense_date LIKE ?
+               WHERE expense_date >= ? AND expense_date < ?
                ORDER BY expense_date DESC""",
-            (prefix + "%",),
+            (start, end),
         ).fetchall()
         return [_row_to_expense(r) for r in rows]
 
+    def iter_by_period(
+        self, year: int, month: int | None = None
+    ) -> Iterator[Expense]:
+        start, end = period_bounds(year, month)
+        cursor = self._conn.execute(
+            """SELECT * FROM expenses
+               WHERE expense_date >= ? AND expense_date < ?
+               ORDER BY expense_date, id""",
+            (start, end),
+        )
+        for row in cursor:
+            yield _row_to_expense(row)
+
+    def get_monthly_totals(self, year: int) -> dict[int, int]:
+        start, end = period_bounds(year)
+        rows = self._conn.execute(
+            """SELECT CAST(substr(expense_date, 6, 2) AS INTEGER) AS month,
+                      SUM(amount) AS total
+               FROM expenses
+               WHERE expense_date >= ? AND expense_date < ?
+               GROUP BY month""",
+            (start, end),
+        ).fetchall()
+        return {r["month"]: r["total"] for r in rows}
+
+    def get_total(self, year: int, month: int | None = None) -> int:
+        start, end = period_bounds(year, month)
+        row = self._conn.execute(
+            """SELECT COALESCE(SUM(amount), 0) AS total
+               FROM expenses
+               WHERE expense_date >= ? AND expense_date < ?""",
+            (start, end),
+        ).fetchone()
+        return row["total"]
+
+    def get_category_totals(
+        self, year: int, month: int | None = None
+    ) -> dict[ExpenseCategory, int]:
+        start, end = period_bounds(year, month)
+        rows = self._conn.execute(
+            """SELECT category, SUM(amount) AS total
+               FROM expenses
+               WHERE expense_date >= ? AND expense_date < ?
+               GROUP BY category""",
+            (start, end),
+        ).fetchall()
+        return {ExpenseCategory(r["category"]): r["total"] for r in rows}
+
     def get_all(self) -> list[Expense]:
         rows = self._conn.execute(
             "SELECT * FROM expenses ORDER BY expense_date DESC"
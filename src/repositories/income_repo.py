@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable
 from datetime import date
 
 from src.models.income import Income, JobType
+from src.repositories.database import period_bounds
 
 
 def _row_to_income(row: sqlite3.Row) -> Income:
@@ -17,6 +19,17 @@ def _row_to_income(row: sqlite3.Row) -> Income:
     )
 
 
+def _income_params(income: Income) -> tuple:
+    """Column values in the order used by INSERT and UPDATE."""
+    return (
+        income.amount,
+        income.income_date.isoformat(),
+        income.client,
+        income.job_type.value,
+        income.notes,
+    )
+
+
 class IncomeRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self._conn = conn
@@ -26,13 +39,7 @@ class IncomeRepository:
             """INSERT INTO incomes
                (amount, income_date, client, job_type, notes)
                VALUES (?, ?, ?, ?, ?)""",
-            (
-                income.amount,
-                income.income_date.isoformat(),
-                income.client,
-                income.job_type.value,
-                income.notes,
-            ),
+            _income_params(income),
         )
         self._conn.commit()
         return Income(
@@ -44,6 +51,15 @@ class IncomeRepository:
             notes=income.notes,
         )
 
+    def insert_many(self, incomes: Iterable[Income]) -> None:
+        self._conn.executemany(
+            """INSERT INTO incomes
+               (amount, income_date, client, job_type, notes)
+               VALUES (?, ?, ?, ?, ?)""",
+            map(_income_params, incomes),
+        )
+        self._conn.commit()
+
     def update(self, income: Income) -> None:
         if income.id is None:
             raise ValueError("Cannot update income without an id")
@@ -51,14 +67,7 @@ class IncomeRepository:
             """UPDATE incomes
                SET amount=?, income_date=?, client=?, job_type=?, notes=?
                WHERE id=?""",
-            (
-                income.amount,
-                income.income_date.isoformat(),
-                income.client,
-                income.job_type.value,
-                income.notes,
-                income.id,
-            ),
+            (*_income_params(income), income.id),
         )
         self._conn.commit()
 
@@ -82,25 +91,37 @@ class IncomeRepository:
         return [_row_to_income(r) for r in rows]
 
     def get_by_month(self, year: int, month: int) -> list[Income]:
-        prefix = f"{year:04d}-{month:02d}"
+        start, end = period_bounds(year, month)
         rows = self._conn.execute(
             """SELECT * FROM incomes
-               WHERE income_date LIKE ?
+               WHERE income_date >= ? AND income_date < ?
                ORDER BY income_date DESC""",
-            (prefix + "%",),
+            (start, end),
         ).fetchall()
         return [_row_to_income(r) for r in rows]
 
     def get_by_year(self, year: int) -> list[Income]:
-        prefix = f"{year:04d}"
+        start, end = period_bounds(year)
         rows = self._conn.execute(
             """SELECT * FROM incomes
-               WHERE income_date LIKE ?
+               WHERE income_date >= ? AND income_date < ?
                ORDER BY income_date DESC""",
-            (prefix + "%",),
+            (start, end),
         ).fetchall()
         return [_row_to_income(r) for r in rows]
 
+    def get_monthly_totals(self, year: int) -> dict[int, int]:
+        start, end = period_bounds(year)
+        rows = self._conn.execute(
+            """SELECT CAST(substr(income_date, 6, 2) AS INTEGER) AS month,
+                      SUM(amount) AS total
+               FROM incomes
+               WHERE income_date >= ? AND income_date < ?
+               GROUP BY month""",
+            (start, end),
+        ).fetchall()
+        return {r["month"]: r["total"] for r in rows}
+
     def get_all(self) -> list[Income]:
         rows = self._conn.execute(
             "SELECT * FROM incomes ORDER BY income_date DESC"
@@ -10,15 +10,22 @@ from src.repositories.event_repo import EventRepository
 class EventService:
     def __init__(self, repo: EventRepository) -> None:
         self._repo = repo
+        # Bumped on every mutation so callers can tell when cached events
+        # are stale
+        self.version = 0
 
     def add_event(self, event: Event) -> Event:
-        return self._repo.insert(event)
+        inserted = self._repo.insert(event)
+        self.version += 1
+        return inserted
 
     def update_event(self, event: Event) -> None:
         self._repo.update(event)
+        self.version += 1
 
     def delete_event(self, event_id: int) -> None:
         self._repo.delete(event_id)
+        self.version += 1
 
     def get_event(self, event_id: int) -> Event | None:
         return self._repo.get_by_id(event_id)
@@ -1,6 +1,7 @@
 """Business logic for expense management."""
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import date
 
 from src.models.expense import Expense, ExpenseCategory
@@ -10,15 +11,26 @@ from src.repositories.expense_repo import ExpenseRepository
 class ExpenseService:
     def __init__(self, repo: ExpenseRepository) -> None:
         self._repo = repo
+        # Incremented on every write, so callers can tell whether data they
+        # loaded earlier is still current
+        self.version = 0
 
     def add_expense(self, expense: Expense) -> Expense:
-        return self._repo.insert(expense)
+        inserted = self._repo.insert(expense)
+        self.version += 1
+        return inserted
+
+    def add_expenses(self, expenses: Iterable[Expense]) -> None:
+        self._repo.insert_many(expenses)
+        self.version += 1
 
     def update_expense(self, expense: Expense) -> None:
         self._repo.update(expense)
+        self.version += 1
 
     def delete_expense(self, expense_id: int) -> None:
         self._repo.delete(expense_id)
+        self.version += 1
 
     def get_expense(self, expense_id: int) -> Expense | None:
         return self._repo.get_by_id(expense_id)
@@ -29,23 +41,29 @@ class ExpenseService:
     def get_yearly_expenses(self, year: int) -> list[Expense]:
         return self._repo.get_by_year(year)
 
+    def iter_monthly_expenses(self, year: int, month: int) -> Iterator[Expense]:
+        return self._repo.iter_by_period(year, month)
+
+    def iter_yearly_expenses(self, year: int) -> Iterator[Expense]:
+        return self._repo.iter_by_period(year)
+
     def get_expenses_in_range(self, start: date, end: date) -> list[Expense]:
         return self._repo.get_by_date_range(start, end)
 
     def monthly_total(self, year: int, month: int) -> int:
-        expenses = self._repo.get_by_month(year, month)
-        return sum(e.amount for e in expenses)
+        return self._repo.get_total(year, month)
+
+    def monthly_totals(self, year: int) -> list[int]:
+        by_month = self._repo.get_monthly_totals(year)
+        return [by_month.get(m, 0) for m in range(1, 13)]
 
     def yearly_total(self, year: int) -> int:
-        expenses = self._repo.get_by_year(year)
-        return sum(e.amount for e in expenses)
-
-    def category_totals(self, year: int) -> dict[ExpenseCategory, int]:
-        expenses = self._repo.get_by_year(year)
-        totals: dict[ExpenseCategory, int] = {}
-        for e in expenses:
-            totals[e.category] = totals.get(e.category, 0) + e.amount
-        return totals
+        return self._repo.get_total(year)
+
+    def category_totals(
+        self, year: int, month: int | None = None
+    ) -> dict[ExpenseCategory, int]:
+        return self._repo.get_category_totals(year, month)
 
     def get_all_expenses(self) -> list[Expense]:
         return self._repo.get_all()
@@ -2,20 +2,49 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TextIO
 
 from src.models.expense import Expense
 from src.models.income import Income
 from src.models.tax import TaxSummary
 
+# Leading characters that make spreadsheet apps treat a cell as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
-def export_tax_summary_csv(summary: TaxSummary, path: Path) -> None:
+
+def _safe_text(value: str) -> str:
+    """Neutralise user text that a spreadsheet would evaluate as a formula."""
+    if value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+@contextmanager
+def _open_output(dest: Path | TextIO) -> Iterator[TextIO]:
+    """Yield a text stream for ``dest`` with the UTF-8 BOM already written.
+
+    Paths are opened with utf-8-sig and closed afterwards; an open text
+    stream (e.g. ``io.StringIO``) gets the BOM written to it and is left
+    open for the caller.
+    """
+    if isinstance(dest, (str, Path)):
+        with open(dest, "w", newline="", encoding="utf-8-sig") as f:
+            yield f
+    else:
+        dest.write("\ufeff")
+        yield dest
+
+
+def export_tax_summary_csv(summary: TaxSummary, dest: Path | TextIO) -> None:
     """Export a yearly tax summary to CSV.
 
     Format designed for easy reference during manual 確定申告 filing.
-    Uses utf-8-sig encoding (BOM) for Excel compatibility.
+    Written with a UTF-8 BOM for Excel compatibility.
     """
-    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+    with _open_output(dest) as f:
         writer = csv.writer(f)
         writer.writerow(["確定申告 データ準備", f"{summary.year}年"])
         writer.writerow([])
@@ -30,9 +59,9 @@ def export_tax_summary_csv(summary: TaxSummary, path: Path) -> None:
             writer.writerow([item.category_label, f"{item.total:,}"])
 
 
-def export_income_csv(incomes: list[Income], path: Path) -> None:
+def export_income_csv(incomes: list[Income], dest: Path | TextIO) -> None:
     """Export income entries to CSV."""
-    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+    with _open_output(dest) as f:
         writer = csv.writer(f)
         writer.writerow([
             "日付 (Date)",
@@ -45,15 +74,22 @@ def export_income_csv(incomes: list[Income], path: Path) -> None:
             writer.writerow([
                 inc.income_date.isoformat(),
                 inc.amount,
-                inc.client,
+                _safe_text(inc.client),
                 inc.job_type.value,
-                inc.notes,
+                _safe_text(inc.notes),
             ])
 
 
-def export_expenses_csv(expenses: list[Expense], path: Path) -> None:
-    """Export expense entries to CSV."""
-    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+def export_expenses_csv(
+    expenses: Iterable[Expense], dest: Path | TextIO
+) -> None:
+    """Export expense entries to CSV.
+
+    Rows are written in the order given as they are consumed, so a lazy
+    iterable (e.g. ``ExpenseService.iter_yearly_expenses``) is streamed to
+    ``dest`` without being held in memory. Pass expenses in date order.
+    """
+    with _open_output(dest) as f:
         writer = csv.writer(f)
         writer.writerow([
             "日付 (Date)",
@@ -63,12 +99,12 @@ def export_expenses_csv(expenses: list[Expense], path: Path) -> None:
             "繰返 (Recurrence)",
             "備考 (Notes)",
         ])
-        for exp in sorted(expenses, key=lambda x: x.expense_date):
+        for exp in expenses:
             writer.writerow([
                 exp.expense_date.isoformat(),
                 exp.amount,
                 exp.category.value,
                 exp.payment_method.value,
                 exp.recurrence.value,
-                exp.notes,
+                _safe_text(exp.notes),
             ])
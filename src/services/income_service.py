@@ -1,6 +1,7 @@
 """Business logic for income management."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date
 
 from src.models.income import Income
@@ -10,15 +11,35 @@ from src.repositories.income_repo import IncomeRepository
 class IncomeService:
     def __init__(self, repo: IncomeRepository) -> None:
         self._repo = repo
+        # Distinct client names, loaded on first use and then kept in step
+        # with inserts; updates and deletes may drop a name, so they reset it
+        self._clients: set[str] | None = None
+        # Incremented on every write; see ExpenseService.version
+        self.version = 0
 
     def add_income(self, income: Income) -> Income:
-        return self._repo.insert(income)
+        inserted = self._repo.insert(income)
+        self.version += 1
+        if self._clients is not None:
+            self._clients.add(inserted.client)
+        return inserted
+
+    def add_incomes(self, incomes: Iterable[Income]) -> None:
+        incomes = list(incomes)
+        self._repo.insert_many(incomes)
+        self.version += 1
+        if self._clients is not None:
+            self._clients.update(i.client for i in incomes)
 
     def update_income(self, income: Income) -> None:
         self._repo.update(income)
+        self.version += 1
+        self._clients = None
 
     def delete_income(self, income_id: int) -> None:
         self._repo.delete(income_id)
+        self.version += 1
+        self._clients = None
 
     def get_income(self, income_id: int) -> Income | None:
         return self._repo.get_by_id(income_id)
@@ -36,12 +57,18 @@ class IncomeService:
         incomes = self._repo.get_by_month(year, month)
         return sum(i.amount for i in incomes)
 
+    def monthly_totals(self, year: int) -> list[int]:
+        by_month = self._repo.get_monthly_totals(year)
+        return [by_month.get(m, 0) for m in range(1, 13)]
+
     def yearly_total(self, year: int) -> int:
         incomes = self._repo.get_by_year(year)
         return sum(i.amount for i in incomes)
 
     def get_distinct_clients(self) -> list[str]:
-        return self._repo.get_distinct_clients()
+        if self._clients is None:
+            self._clients = set(self._repo.get_distinct_clients())
+        return sorted(self._clients)
 
     def get_all_incomes(self) -> list[Income]:
         return self._repo.get_all()
@@ -16,10 +16,25 @@ class TaxService:
     ) -> None:
         self._income = income_service
         self._expense = expense_service
+        # Summaries by year, valid for the (income, expense) versions below
+        self._cache: dict[int, TaxSummary] = {}
+        self._cache_versions: tuple[int, int] = (-1, -1)
 
     def get_tax_summary(self, year: int) -> TaxSummary:
-        gross_income = self._income.yearly_total(year)
-        total_expenses = self._expense.yearly_total(year)
+        versions = (self._income.version, self._expense.version)
+        if versions != self._cache_versions:
+            self._cache.clear()
+            self._cache_versions = versions
+        cached = self._cache.get(year)
+        if cached is not None:
+            return cached
+
+        # The yearly totals fall out of the per-month series, which the
+        # tax tab charts anyway, so two GROUP BY queries cover both
+        monthly_income = tuple(self._income.monthly_totals(year))
+        monthly_expenses = tuple(self._expense.monthly_totals(year))
+        gross_income = sum(monthly_income)
+        total_expenses = sum(monthly_expenses)
         category_totals = self._expense.category_totals(year)
 
         breakdown = tuple(
@@ -33,9 +48,13 @@ class TaxService:
             )
         )
 
-        return TaxSummary(
+        summary = TaxSummary(
             year=year,
             gross_income=gross_income,
             total_expenses=total_expenses,
             expense_breakdown=breakdown,
+            monthly_income=monthly_income,
+            monthly_expenses=monthly_expenses,
         )
+        self._cache[year] = summary
+        return summary
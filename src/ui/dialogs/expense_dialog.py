@@ -15,7 +15,13 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from src.models.expense import Expense, ExpenseCategory, PaymentMethod, RecurrenceType
+from src.models.expense import (
+    EXPENSE_CATEGORY_LABELS,
+    Expense,
+    ExpenseCategory,
+    PaymentMethod,
+    RecurrenceType,
+)
 
 # Human-readable labels for PaymentMethod enum values.
 _PAYMENT_METHOD_LABELS: dict[PaymentMethod, str] = {
@@ -132,24 +138,7 @@ class ExpenseDialog(QDialog):
         This reuses the same mapping that ``Expense.category_label`` provides,
         without requiring an ``Expense`` instance.
         """
-        labels: dict[ExpenseCategory, str] = {
-            ExpenseCategory.RENT: "\u5bb6\u8cc3 (Rent)",
-            ExpenseCategory.UTILITIES: "\u5149\u71b1\u8cbb (Utilities)",
-            ExpenseCategory.SUBSCRIPTIONS: "\u30b5\u30d6\u30b9\u30af (Subscriptions)",
-            ExpenseCategory.GROCERIES: "\u98df\u6599\u54c1 (Groceries)",
-            ExpenseCategory.TRANSPORTATION: "\u4ea4\u901a\u8cbb (Transportation)",
-            ExpenseCategory.INSURANCE: "\u4fdd\u967a (Insurance)",
-            ExpenseCategory.MEDICAL: "\u533b\u7642\u8cbb (Medical)",
-            ExpenseCategory.DINING: "\u5916\u98df (Dining)",
-            ExpenseCategory.ENTERTAINMENT: "\u5a2f\u697d (Entertainment)",
-            ExpenseCategory.EDUCATION: "\u6559\u80b2 (Education)",
-            ExpenseCategory.OFFICE_SUPPLIES: "\u4e8b\u52d9\u7528\u54c1 (Office Supplies)",
-            ExpenseCategory.COMMUNICATION: "\u901a\u4fe1\u8cbb (Communication)",
-            ExpenseCategory.TAX_PAYMENT: "\u7a0e\u91d1 (Tax Payment)",
-            ExpenseCategory.PENSION: "\u5e74\u91d1 (Pension)",
-            ExpenseCategory.OTHER: "\u305d\u306e\u4ed6 (Other)",
-        }
-        return labels[cat]
+        return EXPENSE_CATEGORY_LABELS[cat]
 
     def _populate(self, expense: Expense) -> None:
         """Fill every widget from an existing *expense*."""
@@ -0,0 +1,16 @@
+"""Display formatting helpers shared by the UI widgets."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def format_yen(amount: int) -> str:
+    """Format an integer yen amount with thousands separators, e.g. ¥12,345."""
+    return f"¥{amount:,}"
+
+
+@lru_cache(maxsize=4096)
+def format_amount(amount: int) -> str:
+    """Like format_yen but without the currency sign, e.g. 12,345."""
+    return f"{amount:,}"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import sqlite3
+from functools import partial
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QAction, QKeySequence
@@ -13,7 +14,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
 )
 
-from src.repositories.database import get_connection, init_db
+from src.repositories.database import DEFAULT_DB_PATH, get_connection, init_db
 from src.repositories.expense_repo import ExpenseRepository
 from src.repositories.income_repo import IncomeRepository
 from src.repositories.event_repo import EventRepository
@@ -35,10 +36,8 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
 
         # Database
-        if db_path:
-            self._conn = get_connection(db_path)
-        else:
-            self._conn = get_connection()
+        self._db_path = db_path or DEFAULT_DB_PATH
+        self._conn = get_connection(self._db_path)
         init_db(self._conn)
 
         # Repositories
@@ -60,7 +59,12 @@ class MainWindow(QMainWindow):
 
         # Module widgets
         self._dashboard_widget = DashboardWidget(self._income_service, self._expense_service)
-        self._expenses_widget = ExpensesWidget(self._expense_service)
+        # Background loading needs a second connection to the same database;
+        # an in-memory database is private to self._conn, so load in-thread
+        connect = None
+        if str(self._db_path) != ":memory:":
+            connect = partial(get_connection, self._db_path)
+        self._expenses_widget = ExpensesWidget(self._expense_service, connect=connect)
         self._income_widget = IncomeWidget(self._income_service)
         self._tax_widget = TaxWidget(self._tax_service, self._income_service, self._expense_service)
         self._calendar_widget = CalendarWidget(
@@ -98,30 +102,15 @@ class MainWindow(QMainWindow):
         # View menu
         view_menu = menu_bar.addMenu("&View")
 
-        dashboard_action = QAction("&Dashboard", self)
-        dashboard_action.setShortcut(QKeySequence("Ctrl+1"))
-        dashboard_action.triggered.connect(lambda: self._tabs.setCurrentIndex(0))
-        view_menu.addAction(dashboard_action)
-
-        calendar_action = QAction("&Calendar", self)
-        calendar_action.setShortcut(QKeySequence("Ctrl+2"))
-        calendar_action.triggered.connect(lambda: self._tabs.setCurrentIndex(1))
-        view_menu.addAction(calendar_action)
-
-        expenses_action = QAction("&Expenses", self)
-        expenses_action.setShortcut(QKeySequence("Ctrl+3"))
-        expenses_action.triggered.connect(lambda: self._tabs.setCurrentIndex(2))
-        view_menu.addAction(expenses_action)
-
-        income_action = QAction("&Income", self)
-        income_action.setShortcut(QKeySequence("Ctrl+4"))
-        income_action.triggered.connect(lambda: self._tabs.setCurrentIndex(3))
-        view_menu.addAction(income_action)
-
-        tax_action = QAction("&Tax Prep", self)
-        tax_action.setShortcut(QKeySequence("Ctrl+5"))
-        tax_action.triggered.connect(lambda: self._tabs.setCurrentIndex(4))
-        view_menu.addAction(tax_action)
+        # Each action carries its tab index; one slot handles the whole menu
+        for index, text in enumerate((
+            "&Dashboard", "&Calendar", "&Expenses", "&Income", "&Tax Prep",
+        )):
+            action = QAction(text, self)
+            action.setShortcut(QKeySequence(f"Ctrl+{index + 1}"))
+            action.setData(index)
+            view_menu.addAction(action)
+        view_menu.triggered.connect(self._on_view_action)
 
         # Help menu
         help_menu = menu_bar.addMenu("&Help")
@@ -129,6 +118,9 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
 
+    def _on_view_action(self, action: QAction) -> None:
+        self._tabs.setCurrentIndex(action.data())
+
     def _setup_shortcuts(self) -> None:
         pass  # Shortcuts already bound via menu actions
 
@@ -212,6 +212,9 @@ def get_stylesheet() -> str:
     QLabel#accentRed {{
         color: {EXPENSE_RED};
     }}
+    QLabel#statValue[state="negative"] {{
+        color: {EXPENSE_RED};
+    }}
     QLabel#dimNote {{
         color: {TEXT_DIM};
         font-size: 11px;
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import calendar
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 
 from PyQt6.QtCore import QRectF, Qt, QTime, pyqtSignal
 from PyQt6.QtGui import QAction, QColor, QFont, QPainter, QPen
@@ -31,6 +32,7 @@ from src.services.event_service import EventService
 from src.services.expense_service import ExpenseService
 from src.services.income_service import IncomeService
 from src.ui.dialogs.event_dialog import EventDialog
+from src.ui.formatting import format_yen
 from src.ui import theme as T
 
 # Categories that display a special emoji indicator on the month grid
@@ -38,6 +40,59 @@ _SPECIAL_CATEGORIES = {EventCategory.BIRTHDAY, EventCategory.FAMILY}
 
 _WEEKDAY_HEADERS = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
 
+# Sakamoto's month offsets and days per month (non-leap)
+_SAKAMOTO_T = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Month-grid cell styles: (background, border pen, day-number color)
+_CELL_EMPTY = (QColor(T.CAL_EMPTY_BG), QPen(QColor(T.BORDER), 0.5), None)
+_CELL_NORMAL = (
+    QColor(T.CAL_DAY_BG), QPen(QColor(T.CAL_DAY_BORDER), 1), QColor(T.TEXT),
+)
+_CELL_HOVER = (QColor(T.BG_HOVER), QPen(QColor(T.BORDER), 1), QColor(T.TEXT))
+_CELL_TODAY = (
+    QColor(T.CAL_TODAY_BG), QPen(QColor(T.CAL_TODAY_BORDER), 2),
+    QColor(T.ACCENT_GREEN),
+)
+_CELL_SELECTED = (
+    QColor(T.CAL_SELECTED_BG), QPen(QColor(T.CAL_SELECTED_BORDER), 2),
+    QColor(T.ACCENT_CYAN),
+)
+# A cell that is both today and selected keeps the today day-number color
+_CELL_TODAY_SELECTED = (_CELL_SELECTED[0], _CELL_SELECTED[1], _CELL_TODAY[2])
+_BADGE_BG = QColor(T.ACCENT_CYAN)
+_BADGE_BG.setAlpha(180)
+
+# Painter fonts, shared by every grid and schedule repaint
+_HEADER_FONT = QFont("Meiryo UI", 8, QFont.Weight.Bold)
+_DAY_FONT = QFont("Meiryo UI", 9, QFont.Weight.Bold)
+_AMOUNT_FONT = QFont("Meiryo UI", 7)
+_BADGE_FONT = QFont("Meiryo UI", 7, QFont.Weight.Bold)
+_EMOJI_FONT = QFont("Segoe UI Emoji", 10)
+_TIME_FONT = QFont("Meiryo UI", 8)
+_EVENT_FONT = _DAY_FONT
+_DETAIL_FONT = _AMOUNT_FONT
+
+
+@lru_cache(maxsize=256)
+def _month_layout(year: int, month: int) -> tuple[int, int]:
+    """Return (weekday of the 1st with Monday=0, number of days)."""
+    leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    ndays = _DAYS_IN_MONTH[month - 1] + (1 if month == 2 and leap else 0)
+    y = year - 1 if month < 3 else year
+    sunday_based = (
+        y + y // 4 - y // 100 + y // 400 + _SAKAMOTO_T[month - 1] + 1
+    ) % 7
+    return (sunday_based + 6) % 7, ndays
+
+
+@lru_cache(maxsize=256)
+def _month_days(year: int, month: int) -> tuple[int, ...]:
+    """Day numbers of the month grid in whole weeks (0 for padding cells)."""
+    leading, ndays = _month_layout(year, month)
+    days = (0,) * leading + tuple(range(1, ndays + 1))
+    return days + (0,) * (-len(days) % 7)
+
 
 # ── Custom-Painted Month Grid ───────────────────────────────────────────
 
@@ -47,18 +102,29 @@ class MonthGridWidget(QWidget):
 
     date_clicked = pyqtSignal(object)
 
+    HEADER_H = 22
+    ROWS = 6
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._year = date.today().year
         self._month = date.today().month
         self._events_by_day: dict[int, list[Event]] = {}
-        self._income_by_day: dict[int, int] = {}
-        self._expense_by_day: dict[int, int] = {}
+        # Per-day paint data flattened out of the events in set_month(), so
+        # paintEvent never touches Event attributes
+        self._badge_text: dict[int, str] = {}
+        self._special_days: set[int] = set()
+        # Per-day "+¥n" / "-¥n" labels, formatted once in set_month()
+        self._income_text: dict[int, str] = {}
+        self._expense_text: dict[int, str] = {}
         self._selected_day: int | None = date.today().day
-        self._day_rects: dict[int, QRectF] = {}
+        self._cell_w = 0.0
+        self._cell_h = 0.0
+        self._cell_rects: list[QRectF] = []
         self.setMinimumHeight(300)
         self.setMouseTracking(True)
         self._hover_day: int | None = None
+        self._layout_cells()
 
     def set_month(
         self,
@@ -71,60 +137,127 @@ class MonthGridWidget(QWidget):
         self._year = year
         self._month = month
         self._events_by_day = {}
+        self._special_days = set()
         for ev in events:
-            self._events_by_day.setdefault(ev.event_date.day, []).append(ev)
-        self._income_by_day = income_by_day or {}
-        self._expense_by_day = expense_by_day or {}
+            day = ev.event_date.day
+            self._events_by_day.setdefault(day, []).append(ev)
+            if ev.category in _SPECIAL_CATEGORIES:
+                self._special_days.add(day)
+        self._badge_text = {
+            d: str(len(evs)) for d, evs in self._events_by_day.items()
+        }
+        self._income_text = {
+            d: f"+{format_yen(amt)}"
+            for d, amt in (income_by_day or {}).items() if amt > 0
+        }
+        self._expense_text = {
+            d: f"-{format_yen(amt)}"
+            for d, amt in (expense_by_day or {}).items() if amt > 0
+        }
         if self._selected_day:
-            max_day = calendar.monthrange(year, month)[1]
+            max_day = _month_layout(year, month)[1]
             if self._selected_day > max_day:
                 self._selected_day = 1
         self.update()
 
     def set_selected(self, day: int) -> None:
+        self._select_day(day)
+
+    def events_for_day(self, day: int) -> list[Event]:
+        """Events already loaded for a day of the displayed month."""
+        return list(self._events_by_day.get(day, ()))
+
+    def _select_day(self, day: int) -> None:
+        # Only the previously selected and newly selected cells change
+        if day == self._selected_day:
+            return
+        self._update_day(self._selected_day)
         self._selected_day = day
-        self.update()
+        self._update_day(day)
+
+    # ── Cell geometry ──
+
+    def _layout_cells(self) -> None:
+        """Recompute the 6x7 cell rects; only needed when the size changes."""
+        self._cell_w = self.width() / 7
+        self._cell_h = (self.height() - self.HEADER_H) / self.ROWS
+        self._cell_rects = [
+            QRectF(
+                col * self._cell_w, self.HEADER_H + row * self._cell_h,
+                self._cell_w, self._cell_h,
+            )
+            for row in range(self.ROWS)
+            for col in range(7)
+        ]
+
+    def _day_at(self, pos) -> int | None:
+        y = pos.y() - self.HEADER_H
+        if y < 0 or pos.x() < 0 or self._cell_w <= 0 or self._cell_h <= 0:
+            return None
+        col = int(pos.x() // self._cell_w)
+        row = int(y // self._cell_h)
+        if col >= 7 or row >= self.ROWS:
+            return None
+        days = _month_days(self._year, self._month)
+        idx = row * 7 + col
+        if idx >= len(days):
+            return None
+        return days[idx] or None
+
+    def _rect_for_day(self, day: int) -> QRectF | None:
+        days = _month_days(self._year, self._month)
+        idx = days.index(1) + day - 1
+        if idx >= len(self._cell_rects):
+            return None
+        return self._cell_rects[idx]
+
+    def resizeEvent(self, event) -> None:
+        self._layout_cells()
+        super().resizeEvent(event)
+
+    # ── Mouse interaction ──
 
     def mousePressEvent(self, event) -> None:
-        pos = event.position()
-        for day, rect in self._day_rects.items():
-            if rect.contains(pos):
-                self._selected_day = day
-                self.update()
-                self.date_clicked.emit(date(self._year, self._month, day))
-                return
+        day = self._day_at(event.position())
+        if day is not None:
+            self._select_day(day)
+            self.date_clicked.emit(date(self._year, self._month, day))
 
     def mouseMoveEvent(self, event) -> None:
-        pos = event.position()
-        new_hover = None
-        for day, rect in self._day_rects.items():
-            if rect.contains(pos):
-                new_hover = day
-                break
+        new_hover = self._day_at(event.position())
         if new_hover != self._hover_day:
+            self._update_day(self._hover_day)
             self._hover_day = new_hover
-            self.update()
+            self._update_day(new_hover)
 
     def leaveEvent(self, event) -> None:
+        self._update_day(self._hover_day)
         self._hover_day = None
-        self.update()
+
+    def _update_day(self, day: int | None) -> None:
+        """Schedule a repaint of a single day cell (hover/selection changes)."""
+        rect = self._rect_for_day(day) if day is not None else None
+        if rect is not None:
+            self.update(rect.toAlignedRect())
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Only the exposed region needs drawing; on the first paint (and any
+        # full update()) this is the whole widget.
+        exposed = QRectF(event.rect())
+        painter.setClipRect(event.rect())
 
         w = self.width()
         h = self.height()
         painter.fillRect(self.rect(), QColor(T.BG_DARKEST))
 
-        header_h = 22
-        cell_w = w / 7
-        rows = 6
-        cell_h = (h - header_h) / rows
+        header_h = self.HEADER_H
+        cell_w = self._cell_w
+        cell_h = self._cell_h
 
         # Weekday headers
-        header_font = QFont("Meiryo UI", 8, QFont.Weight.Bold)
-        painter.setFont(header_font)
+        painter.setFont(_HEADER_FONT)
         painter.setPen(QColor(T.ACCENT_CYAN))
         for col, hdr in enumerate(_WEEKDAY_HEADERS):
             rect = QRectF(col * cell_w, 0, cell_w, header_h)
@@ -134,137 +267,100 @@ class MonthGridWidget(QWidget):
         painter.drawLine(0, int(header_h), w, int(header_h))
 
         # Day cells
-        cal_obj = calendar.Calendar(firstweekday=0)
-        days = list(cal_obj.itermonthdays(self._year, self._month))
+        days = _month_days(self._year, self._month)
         today = date.today()
 
-        day_font = QFont("Meiryo UI", 9, QFont.Weight.Bold)
-        amount_font = QFont("Meiryo UI", 7)
-        badge_font = QFont("Meiryo UI", 7, QFont.Weight.Bold)
-        emoji_font = QFont("Segoe UI Emoji", 10)
-        self._day_rects.clear()
-
-        idx = 0
-        for row in range(rows):
-            for col in range(7):
-                if idx >= len(days):
-                    break
-                day = days[idx]
-                idx += 1
-
-                x = col * cell_w
-                y = header_h + row * cell_h
-                cell_rect = QRectF(x + 1, y + 1, cell_w - 2, cell_h - 2)
-
-                if day == 0:
-                    painter.fillRect(cell_rect, QColor(T.CAL_EMPTY_BG))
-                    painter.setPen(QPen(QColor(T.BORDER), 0.5))
-                    painter.drawRect(cell_rect)
-                    continue
-
-                self._day_rects[day] = cell_rect
-
-                is_today = (
-                    self._year == today.year
-                    and self._month == today.month
-                    and day == today.day
-                )
-                is_selected = day == self._selected_day
-                is_hover = day == self._hover_day
-
-                if is_selected:
-                    bg = QColor(T.CAL_SELECTED_BG)
-                    border_color = QColor(T.CAL_SELECTED_BORDER)
-                    border_width = 2
-                elif is_today:
-                    bg = QColor(T.CAL_TODAY_BG)
-                    border_color = QColor(T.CAL_TODAY_BORDER)
-                    border_width = 2
-                elif is_hover:
-                    bg = QColor(T.BG_HOVER)
-                    border_color = QColor(T.BORDER)
-                    border_width = 1
-                else:
-                    bg = QColor(T.CAL_DAY_BG)
-                    border_color = QColor(T.CAL_DAY_BORDER)
-                    border_width = 1
+        for day, cell in zip(days, self._cell_rects):
+            if not exposed.intersects(cell):
+                continue
+            x = cell.x()
+            y = cell.y()
+            cell_rect = cell.adjusted(1, 1, -1, -1)
 
+            if day == 0:
+                bg, border_pen, _ = _CELL_EMPTY
                 painter.fillRect(cell_rect, bg)
-                painter.setPen(QPen(border_color, border_width))
+                painter.setPen(border_pen)
                 painter.drawRect(cell_rect)
+                continue
+
+            is_today = (
+                self._year == today.year
+                and self._month == today.month
+                and day == today.day
+            )
+
+            if day == self._selected_day:
+                style = _CELL_TODAY_SELECTED if is_today else _CELL_SELECTED
+            elif is_today:
+                style = _CELL_TODAY
+            elif day == self._hover_day:
+                style = _CELL_HOVER
+            else:
+                style = _CELL_NORMAL
+            bg, border_pen, day_color = style
+
+            painter.fillRect(cell_rect, bg)
+            painter.setPen(border_pen)
+            painter.drawRect(cell_rect)
 
-                # ── Day number (top-left) ──
-                painter.setFont(day_font)
-                if is_today:
-                    painter.setPen(QColor(T.ACCENT_GREEN))
-                elif is_selected:
-                    painter.setPen(QColor(T.ACCENT_CYAN))
-                else:
-                    painter.setPen(QColor(T.TEXT))
+            # ── Day number (top-left) ──
+            painter.setFont(_DAY_FONT)
+            painter.setPen(day_color)
+            painter.drawText(
+                QRectF(x + 3, y + 2, 22, 14),
+                Qt.AlignmentFlag.AlignLeft, str(day),
+            )
+
+            # ── Event count badge (top-right corner) ──
+            badge_text = self._badge_text.get(day)
+            if badge_text:
+                painter.setFont(_BADGE_FONT)
+                fm = painter.fontMetrics()
+                tw = fm.horizontalAdvance(badge_text)
+                badge_w = max(tw + 5, 13)
+                badge_h = 12
+                badge_x = x + cell_w - badge_w - 3
+                badge_y = y + 3
+                badge_rect = QRectF(badge_x, badge_y, badge_w, badge_h)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(_BADGE_BG)
+                painter.drawRoundedRect(badge_rect, 3, 3)
+                painter.setPen(QColor(T.BG_DARKEST))
                 painter.drawText(
-                    QRectF(x + 3, y + 2, 22, 14),
-                    Qt.AlignmentFlag.AlignLeft, str(day),
+                    badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text,
+                )
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+
+            # ── Revenue & expense amounts (below day number) ──
+            painter.setFont(_AMOUNT_FONT)
+            info_y = y + 18
+            income_text = self._income_text.get(day)
+            expense_text = self._expense_text.get(day)
+            if income_text:
+                painter.setPen(QColor(T.INCOME_GREEN))
+                painter.drawText(
+                    QRectF(x + 3, info_y, cell_w - 6, 11),
+                    Qt.AlignmentFlag.AlignLeft, income_text,
+                )
+                info_y += 11
+            if expense_text:
+                painter.setPen(QColor(T.EXPENSE_RED))
+                painter.drawText(
+                    QRectF(x + 3, info_y, cell_w - 6, 11),
+                    Qt.AlignmentFlag.AlignLeft, expense_text,
                 )
 
-                # ── Event count badge (top-right corner) ──
-                events_today = self._events_by_day.get(day, [])
-                num_events = len(events_today)
-                if num_events > 0:
-                    badge_text = str(num_events)
-                    painter.setFont(badge_font)
-                    fm = painter.fontMetrics()
-                    tw = fm.horizontalAdvance(badge_text)
-                    badge_w = max(tw + 5, 13)
-                    badge_h = 12
-                    badge_x = x + cell_w - badge_w - 3
-                    badge_y = y + 3
-                    badge_rect = QRectF(badge_x, badge_y, badge_w, badge_h)
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    badge_bg = QColor(T.ACCENT_CYAN)
-                    badge_bg.setAlpha(180)
-                    painter.setBrush(badge_bg)
-                    painter.drawRoundedRect(badge_rect, 3, 3)
-                    painter.setPen(QColor(T.BG_DARKEST))
-                    painter.drawText(
-                        badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text,
-                    )
-                    painter.setBrush(Qt.BrushStyle.NoBrush)
-
-                # ── Revenue & expense amounts (below day number) ──
-                painter.setFont(amount_font)
-                info_y = y + 18
-                income_amt = self._income_by_day.get(day, 0)
-                expense_amt = self._expense_by_day.get(day, 0)
-                if income_amt > 0:
-                    painter.setPen(QColor(T.INCOME_GREEN))
-                    text = f"+\u00a5{income_amt:,}"
-                    painter.drawText(
-                        QRectF(x + 3, info_y, cell_w - 6, 11),
-                        Qt.AlignmentFlag.AlignLeft, text,
-                    )
-                    info_y += 11
-                if expense_amt > 0:
-                    painter.setPen(QColor(T.EXPENSE_RED))
-                    text = f"-\u00a5{expense_amt:,}"
-                    painter.drawText(
-                        QRectF(x + 3, info_y, cell_w - 6, 11),
-                        Qt.AlignmentFlag.AlignLeft, text,
-                    )
-
-                # ── Birthday/anniversary emoji (bottom-right) ──
-                has_special = any(
-                    ev.category in _SPECIAL_CATEGORIES
-                    for ev in events_today
+            # ── Birthday/anniversary emoji (bottom-right) ──
+            if day in self._special_days:
+                painter.setFont(_EMOJI_FONT)
+                painter.setPen(QColor(T.TEXT_BRIGHT))
+                painter.drawText(
+                    QRectF(
+                        x + cell_w - 18, y + cell_h - 16, 15, 14,
+                    ),
+                    Qt.AlignmentFlag.AlignCenter, "\U0001f382",
                 )
-                if has_special:
-                    painter.setFont(emoji_font)
-                    painter.setPen(QColor(T.TEXT_BRIGHT))
-                    painter.drawText(
-                        QRectF(
-                            x + cell_w - 18, y + cell_h - 16, 15, 14,
-                        ),
-                        Qt.AlignmentFlag.AlignCenter, "\U0001f382",
-                    )
 
         painter.end()
 
@@ -352,10 +448,6 @@ class ScheduleGridWidget(QWidget):
 
         painter.fillRect(self.rect(), QColor(T.BG_DARKEST))
 
-        time_font = QFont("Meiryo UI", 8)
-        event_font = QFont("Meiryo UI", 9, QFont.Weight.Bold)
-        detail_font = QFont("Meiryo UI", 7)
-
         # ── Grid lines & time labels ──
         for slot in range(self._total_slots + 1):
             y = tm + slot * sh
@@ -368,7 +460,7 @@ class ScheduleGridWidget(QWidget):
             if minute == 0:
                 painter.setPen(QPen(QColor(T.BORDER), 1))
                 painter.drawLine(int(lm), int(y), int(w - rm), int(y))
-                painter.setFont(time_font)
+                painter.setFont(_TIME_FONT)
                 painter.setPen(QColor(T.TEXT_DIM))
                 painter.drawText(
                     0, int(y - 7), lm - 6, 14,
@@ -423,7 +515,7 @@ class ScheduleGridWidget(QWidget):
                     QRectF(lm, 0, 3, banner_h), color,
                 )
                 painter.setPen(QColor(T.TEXT_BRIGHT))
-                painter.setFont(detail_font)
+                painter.setFont(_DETAIL_FONT)
                 painter.drawText(
                     QRectF(lm + 6, 0, track_w - 12, banner_h),
                     Qt.AlignmentFlag.AlignVCenter,
@@ -473,7 +565,7 @@ class ScheduleGridWidget(QWidget):
                 block_rect.width() - 12, min(block_h - 4, 16),
             )
             painter.setPen(QColor(T.TEXT_BRIGHT))
-            painter.setFont(event_font)
+            painter.setFont(_EVENT_FONT)
             painter.drawText(
                 text_rect, Qt.AlignmentFlag.AlignVCenter, ev.title,
             )
@@ -483,7 +575,7 @@ class ScheduleGridWidget(QWidget):
                 ts = st.strftime("%H:%M")
                 if et:
                     ts += f" - {et.strftime('%H:%M')}"
-                painter.setFont(detail_font)
+                painter.setFont(_DETAIL_FONT)
                 painter.setPen(QColor(T.TEXT_DIM))
                 painter.drawText(
                     QRectF(
@@ -497,8 +589,9 @@ class ScheduleGridWidget(QWidget):
                 self._event_rects[ev.id] = block_rect
 
         # ── Current time red indicator ──
-        if self._date == date.today():
-            now = datetime.now().time()
+        now_dt = datetime.now()
+        if self._date == now_dt.date():
+            now = now_dt.time()
             if self.START_HOUR <= now.hour < self.END_HOUR:
                 frac = (now.hour - self.START_HOUR) * 4 + now.minute / 15
                 cy = tm + frac * sh
@@ -577,6 +670,8 @@ class DayDetailPanel(QWidget):
         super().__init__(parent)
         self._service = event_service
         self._current_date: date = date.today()
+        self._events: list[Event] = []
+        self._list_stale = True
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(6, 6, 6, 6)
@@ -632,6 +727,8 @@ class DayDetailPanel(QWidget):
 
         # List view
         self._list = QListWidget()
+        # One line of text per event, so rows never need individual sizing
+        self._list.setUniformItemSizes(True)
         self._list.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu
         )
@@ -640,6 +737,8 @@ class DayDetailPanel(QWidget):
         )
         self._list.doubleClicked.connect(self._on_edit_from_list)
         self._stack.addWidget(self._list)
+        # The list is only rebuilt once its page is actually shown
+        self._stack.currentChanged.connect(self._on_page_changed)
 
         layout.addWidget(self._stack)
 
@@ -651,22 +750,34 @@ class DayDetailPanel(QWidget):
         self._empty_label.setWordWrap(True)
         layout.addWidget(self._empty_label)
 
-    def show_date(self, d: date) -> None:
+    def show_date(self, d: date, events: list[Event] | None = None) -> None:
+        """Show a day; pass *events* when they are already loaded."""
         self._current_date = d
         self._date_label.setText(f"{d.strftime('%A')}  {d.isoformat()}")
-        self.refresh()
+        self.refresh(events)
 
-    def refresh(self) -> None:
-        events = self._service.get_events_for_date(self._current_date)
+    def refresh(self, events: list[Event] | None = None) -> None:
+        if events is None:
+            events = self._service.get_events_for_date(self._current_date)
+        self._events = events
+        self._list_stale = True
         self._schedule.set_data(self._current_date, events)
-        self._list.clear()
 
         # Always show the schedule grid
         self._stack.show()
         self._stack.setCurrentIndex(0)
         self._empty_label.setVisible(not events)
 
-        for ev in events:
+    def _on_page_changed(self, index: int) -> None:
+        if index == 1 and self._list_stale:
+            self._populate_list()
+
+    def _populate_list(self) -> None:
+        self._list_stale = False
+        # Rebuild with updates off so the view relayouts once, not per item
+        self._list.setUpdatesEnabled(False)
+        self._list.clear()
+        for ev in self._events:
             if ev.start_time:
                 ts = ev.start_time.strftime("%H:%M")
                 if ev.end_time:
@@ -681,6 +792,7 @@ class DayDetailPanel(QWidget):
             item.setData(Qt.ItemDataRole.UserRole, ev.id)
             item.setForeground(QColor(ev.display_color))
             self._list.addItem(item)
+        self._list.setUpdatesEnabled(True)
 
     def scroll_to_now(self) -> None:
         """Scroll the schedule so the current time is visible."""
@@ -790,6 +902,10 @@ class CalendarWidget(QWidget):
         self._service = event_service
         self._income_service = income_service
         self._expense_service = expense_service
+        # (year, month) -> events, valid while _events_version matches the
+        # service's version
+        self._month_events: dict[tuple[int, int], list[Event]] = {}
+        self._events_version = -1
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -840,13 +956,13 @@ class CalendarWidget(QWidget):
         self._detail.scroll_to_now()
 
     def refresh_calendar(self) -> None:
-        events = self._service.get_events_for_month(self._year, self._month)
+        events = self._events_for_month(self._year, self._month)
 
         # Gather financial data for the month
         income_by_day: dict[int, int] = {}
         expense_by_day: dict[int, int] = {}
         if self._income_service and self._expense_service:
-            _, num_days = calendar.monthrange(self._year, self._month)
+            _, num_days = _month_layout(self._year, self._month)
             start = date(self._year, self._month, 1)
             end = date(self._year, self._month, num_days)
             for inc in self._income_service.get_incomes_in_range(start, end):
@@ -866,8 +982,19 @@ class CalendarWidget(QWidget):
             f"{calendar.month_name[self._month].upper()}  {self._year}"
         )
 
+    def _events_for_month(self, year: int, month: int) -> list[Event]:
+        if self._events_version != self._service.version:
+            self._month_events.clear()
+            self._events_version = self._service.version
+        events = self._month_events.get((year, month))
+        if events is None:
+            events = self._service.get_events_for_month(year, month)
+            self._month_events[(year, month)] = events
+        return events
+
     def _on_date_clicked(self, d: date) -> None:
-        self._detail.show_date(d)
+        # The month grid already holds this month's events; reuse them
+        self._detail.show_date(d, self._calendar.events_for_day(d.day))
 
     def _go_prev(self) -> None:
         if self._month == 1:
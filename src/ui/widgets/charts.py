@@ -8,15 +8,32 @@ from __future__ import annotations
 import math
 from typing import Sequence
 
-from PyQt6.QtCore import QRectF, Qt
-from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from PyQt6.QtCore import QLineF, QPointF, QRectF, Qt
+from PyQt6.QtGui import (
+    QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap, QPolygonF,
+)
 from PyQt6.QtWidgets import QWidget
 
+from src.ui.formatting import format_yen
 from src.ui.theme import (
     ACCENT_CYAN, ACCENT_GREEN, ACCENT_RED, ACCENT_YELLOW, ACCENT_ORANGE,
     BG_DARKEST, BG_MID, BORDER, EXPENSE_RED, INCOME_GREEN, TEXT, TEXT_DIM,
 )
 
+# Shared QColor instances so paint events don't rebuild them every frame
+_C_BG_DARKEST = QColor(BG_DARKEST)
+_C_BG_MID = QColor(BG_MID)
+_C_BORDER = QColor(BORDER)
+_C_TEXT = QColor(TEXT)
+_C_TEXT_DIM = QColor(TEXT_DIM)
+_C_INCOME_GREEN = QColor(INCOME_GREEN)
+_C_EXPENSE_RED = QColor(EXPENSE_RED)
+_C_ACCENT_CYAN = QColor(ACCENT_CYAN)
+
+# Below this many pixels in either direction (e.g. a collapsed splitter pane
+# mid-drag) there is nothing legible to draw, so paint events bail out early
+_MIN_PAINT_SIZE = 20
+
 
 # ── Bar Chart ────────────────────────────────────────────────────────────
 
@@ -25,20 +42,25 @@ class BarChartWidget(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._labels: list[str] = []
-        self._series_a: list[int] = []  # e.g. income
-        self._series_b: list[int] = []  # e.g. expenses
+        self._labels: Sequence[str] = ()
+        self._series_a: Sequence[int] = ()  # e.g. income
+        self._series_b: Sequence[int] = ()  # e.g. expenses
         self._label_a = "Income"
         self._label_b = "Expenses"
-        self._color_a = QColor(INCOME_GREEN)
-        self._color_b = QColor(EXPENSE_RED)
+        self._color_a = _C_INCOME_GREEN
+        self._color_b = _C_EXPENSE_RED
+        self._text_font = QFont("Meiryo UI", 8)
+        # Derived from the data in set_data() so paintEvent only scales them
+        self._max_val = 1
+        self._grid_labels: list[tuple[float, str]] = []
+        self._legend_offset = 0
         self.setMinimumHeight(220)
 
     def set_data(
         self,
-        labels: list[str],
-        series_a: list[int],
-        series_b: list[int],
+        labels: Sequence[str],
+        series_a: Sequence[int],
+        series_b: Sequence[int],
         label_a: str = "Income",
         label_b: str = "Expenses",
     ) -> None:
@@ -47,11 +69,23 @@ class BarChartWidget(QWidget):
         self._series_b = series_b
         self._label_a = label_a
         self._label_b = label_b
+
+        max_val = max(max(series_a, default=0), max(series_b, default=0), 1)
+        # Round up to nice number
+        magnitude = 10 ** (len(str(max_val)) - 1)
+        self._max_val = math.ceil(max_val / magnitude) * magnitude
+        self._grid_labels = [
+            (i / 4, format_yen(int(self._max_val * i / 4))) for i in range(5)
+        ]
+        metrics = QFontMetrics(self._text_font)
+        self._legend_offset = metrics.horizontalAdvance(label_a) + 30
         self.update()
 
     def paintEvent(self, event) -> None:
         if not self._labels:
             return
+        if self.width() < _MIN_PAINT_SIZE or self.height() < _MIN_PAINT_SIZE:
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -65,30 +99,29 @@ class BarChartWidget(QWidget):
         chart_h = h - margin_top - margin_bottom
 
         # Background
-        painter.fillRect(self.rect(), QColor(BG_DARKEST))
+        painter.fillRect(self.rect(), _C_BG_DARKEST)
 
         # Draw grid / axis
-        max_val = max(max(self._series_a, default=0), max(self._series_b, default=0), 1)
-        # Round up to nice number
-        magnitude = 10 ** (len(str(max_val)) - 1)
-        max_val = math.ceil(max_val / magnitude) * magnitude
-
-        grid_pen = QPen(QColor(BORDER))
+        max_val = self._max_val
+        grid_pen = QPen(_C_BORDER)
         grid_pen.setStyle(Qt.PenStyle.DotLine)
-        text_font = QFont("Meiryo UI", 8)
-        painter.setFont(text_font)
-
-        # Y-axis gridlines
-        for i in range(5):
-            y = margin_top + chart_h - (i / 4) * chart_h
-            val = int(max_val * i / 4)
-            painter.setPen(grid_pen)
-            painter.drawLine(int(margin_left), int(y), int(w - margin_right), int(y))
-            painter.setPen(QColor(TEXT_DIM))
+        painter.setFont(self._text_font)
+
+        # Y-axis gridlines: all lines with one pen, then all tick labels
+        grid_ys = [
+            int(margin_top + chart_h - frac * chart_h)
+            for frac, _ in self._grid_labels
+        ]
+        painter.setPen(grid_pen)
+        painter.drawLines([
+            QLineF(margin_left, y, int(w - margin_right), y) for y in grid_ys
+        ])
+        painter.setPen(_C_TEXT_DIM)
+        for y, (_, val_text) in zip(grid_ys, self._grid_labels):
             painter.drawText(
-                0, int(y - 8), margin_left - 8, 16,
+                0, y - 8, margin_left - 8, 16,
                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                f"¥{val:,}",
+                val_text,
             )
 
         # Bars
@@ -116,8 +149,8 @@ class BarChartWidget(QWidget):
                 self._color_b,
             )
 
-            # X-axis label
-            painter.setPen(QColor(TEXT_DIM))
+        # X-axis labels (pen is still TEXT_DIM from the tick labels)
+        for i in range(n):
             painter.drawText(
                 int(margin_left + group_w * i), int(margin_top + chart_h + 4),
                 int(group_w), 20,
@@ -129,9 +162,9 @@ class BarChartWidget(QWidget):
         legend_y = 8
         legend_x = margin_left
         painter.fillRect(QRectF(legend_x, legend_y, 10, 10), self._color_a)
-        painter.setPen(QColor(TEXT))
+        painter.setPen(_C_TEXT)
         painter.drawText(legend_x + 14, legend_y + 10, self._label_a)
-        offset = painter.fontMetrics().horizontalAdvance(self._label_a) + 30
+        offset = self._legend_offset
         painter.fillRect(QRectF(legend_x + offset, legend_y, 10, 10), self._color_b)
         painter.drawText(legend_x + offset + 14, legend_y + 10, self._label_b)
 
@@ -144,6 +177,7 @@ _DONUT_COLORS = [
     ACCENT_CYAN, ACCENT_GREEN, ACCENT_YELLOW, ACCENT_ORANGE,
     ACCENT_RED, "#ba68c8", "#4fc3f7", "#81c784", "#ffb74d", "#e57373",
 ]
+_DONUT_QCOLORS = [QColor(c) for c in _DONUT_COLORS]
 
 
 class DonutChartWidget(QWidget):
@@ -151,29 +185,66 @@ class DonutChartWidget(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._slices: list[tuple[str, int, QColor]] = []
+        # (colour, span in 1/16 degrees, legend text), built in set_data()
+        self._slices: list[tuple[QColor, int, str]] = []
+        self._items: tuple[tuple[str, int], ...] = ()
         self._total = 0
         self._center_label = ""
+        self._center_font = QFont("Meiryo UI", 10, QFont.Weight.Bold)
+        self._legend_font = QFont("Meiryo UI", 9)
+        # Rendered chart, reused until the data, size or pixel ratio changes
+        self._cache: QPixmap | None = None
         self.setMinimumHeight(220)
         self.setMinimumWidth(300)
 
     def set_data(
         self,
-        items: list[tuple[str, int]],  # (label, value)
+        items: Sequence[tuple[str, int]],  # (label, value)
         center_label: str = "",
     ) -> None:
-        self._total = sum(v for _, v in items)
+        items = tuple(items)
+        # Same data as last time: keep the slices and the rendered pixmap
+        if items == self._items and center_label == self._center_label:
+            return
+        self._items = items
+        total = sum(v for _, v in items)
+        self._total = total
         self._slices = []
-        for i, (label, value) in enumerate(items):
-            color = QColor(_DONUT_COLORS[i % len(_DONUT_COLORS)])
-            self._slices.append((label, value, color))
+        if total:
+            for i, (label, value) in enumerate(items):
+                color = _DONUT_QCOLORS[i % len(_DONUT_QCOLORS)]
+                share = value / total
+                self._slices.append((
+                    color,
+                    int(share * 360 * 16),
+                    f"{label}  {format_yen(value)} ({share * 100:.0f}%)",
+                ))
         self._center_label = center_label
+        self._cache = None
         self.update()
 
+    def resizeEvent(self, event) -> None:
+        self._cache = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event) -> None:
         if not self._slices or self._total == 0:
             return
+        if self.width() < _MIN_PAINT_SIZE or self.height() < _MIN_PAINT_SIZE:
+            return
+        # Re-render when the window has moved to a screen with another scale
+        if (self._cache is None
+                or self._cache.devicePixelRatio() != self.devicePixelRatioF()):
+            self._cache = self._render()
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+        painter.end()
+
+    def _render(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         w = self.width()
@@ -186,30 +257,28 @@ class DonutChartWidget(QWidget):
         cx = chart_size / 2 + 10
         cy = h / 2
 
-        painter.fillRect(self.rect(), QColor(BG_DARKEST))
+        painter.fillRect(self.rect(), _C_BG_DARKEST)
 
         # Draw arcs
         rect = QRectF(cx - outer_r, cy - outer_r, outer_r * 2, outer_r * 2)
         start_angle = 90 * 16  # top
 
-        for label, value, color in self._slices:
-            span = int((value / self._total) * 360 * 16)
+        for color, span, _ in self._slices:
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(color)
             painter.drawPie(rect, start_angle, -span)
             start_angle -= span
 
         # Inner circle (donut hole)
-        painter.setBrush(QColor(BG_DARKEST))
+        painter.setBrush(_C_BG_DARKEST)
         painter.drawEllipse(
             QRectF(cx - inner_r, cy - inner_r, inner_r * 2, inner_r * 2)
         )
 
         # Center text
         if self._center_label:
-            painter.setPen(QColor(TEXT))
-            font = QFont("Meiryo UI", 10, QFont.Weight.Bold)
-            painter.setFont(font)
+            painter.setPen(_C_TEXT)
+            painter.setFont(self._center_font)
             painter.drawText(
                 QRectF(cx - inner_r, cy - 12, inner_r * 2, 24),
                 Qt.AlignmentFlag.AlignCenter,
@@ -219,20 +288,16 @@ class DonutChartWidget(QWidget):
         # Legend (right side)
         legend_x = int(chart_size + 30)
         legend_y = max(20, int(cy - len(self._slices) * 22 / 2))
-        font = QFont("Meiryo UI", 9)
-        painter.setFont(font)
+        painter.setFont(self._legend_font)
+        painter.setPen(_C_TEXT)
 
-        for label, value, color in self._slices:
+        for color, _, text in self._slices:
             painter.fillRect(QRectF(legend_x, legend_y, 12, 12), color)
-            pct = (value / self._total * 100) if self._total else 0
-            painter.setPen(QColor(TEXT))
-            painter.drawText(
-                legend_x + 18, legend_y + 11,
-                f"{label}  ¥{value:,} ({pct:.0f}%)",
-            )
+            painter.drawText(legend_x + 18, legend_y + 11, text)
             legend_y += 22
 
         painter.end()
+        return pixmap
 
 
 # ── Sparkline ────────────────────────────────────────────────────────────
@@ -243,38 +308,40 @@ class SparklineWidget(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._values: list[int] = []
-        self._color = QColor(ACCENT_CYAN)
+        # (x, y) in 0..1, y measured from the top; scaled to pixels on paint
+        self._points: list[tuple[float, float]] = []
+        self._color = _C_ACCENT_CYAN
         self.setFixedHeight(50)
         self.setMinimumWidth(120)
 
     def set_data(self, values: list[int], color: str = ACCENT_CYAN) -> None:
         self._values = values
         self._color = QColor(color)
+        n = len(values)
+        if n >= 2:
+            max_v = max(values) or 1
+            self._points = [
+                (i / (n - 1), 1 - v / max_v) for i, v in enumerate(values)
+            ]
+        else:
+            self._points = []
         self.update()
 
     def paintEvent(self, event) -> None:
         if len(self._values) < 2:
             return
+        if self.width() < _MIN_PAINT_SIZE or self.height() < _MIN_PAINT_SIZE:
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.fillRect(self.rect(), QColor(BG_MID))
+        painter.fillRect(self.rect(), _C_BG_MID)
 
         w = self.width() - 4
         h = self.height() - 4
-        max_v = max(self._values) or 1
-        n = len(self._values)
 
         pen = QPen(self._color, 2)
         painter.setPen(pen)
-
-        path = QPainterPath()
-        for i, v in enumerate(self._values):
-            x = 2 + (i / (n - 1)) * w
-            y = 2 + h - (v / max_v) * h
-            if i == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
-
-        painter.drawPath(path)
+        painter.drawPolyline(QPolygonF([
+            QPointF(2 + fx * w, 2 + fy * h) for fx, fy in self._points
+        ]))
         painter.end()
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QComboBox,
     QFrame,
@@ -15,9 +15,12 @@ from PyQt6.QtWidgets import (
 
 from src.services.expense_service import ExpenseService
 from src.services.income_service import IncomeService
+from src.ui.formatting import format_yen
 from src.ui.widgets.charts import BarChartWidget, SparklineWidget
 from src.ui import theme as T
 
+_MONTH_LABELS: tuple[str, ...] = tuple(f"{m}月" for m in range(1, 13))
+
 
 class DashboardWidget(QWidget):
     """Top-level overview: income vs expenses bar chart, stat cards, sparklines."""
@@ -48,7 +51,14 @@ class DashboardWidget(QWidget):
         current_year = date.today().year
         for y in range(current_year, current_year - 5, -1):
             self._year_combo.addItem(str(y), y)
-        self._year_combo.currentIndexChanged.connect(lambda _: self.refresh())
+        # Coalesce rapid year changes (e.g. arrow keys) into one refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(120)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._year_combo.currentIndexChanged.connect(
+            lambda _: self._refresh_timer.start()
+        )
         header.addWidget(self._year_combo)
         layout.addLayout(header)
 
@@ -56,10 +66,15 @@ class DashboardWidget(QWidget):
         cards = QHBoxLayout()
         cards.setSpacing(12)
 
-        self._ytd_income_val, self._ytd_income_card = self._make_card("YTD INCOME")
-        self._ytd_expense_val, self._ytd_expense_card = self._make_card("YTD EXPENSES")
+        self._ytd_income_val, self._ytd_income_card = self._make_card(
+            "YTD INCOME", accent="accentGreen"
+        )
+        self._ytd_expense_val, self._ytd_expense_card = self._make_card(
+            "YTD EXPENSES", accent="accentRed"
+        )
         self._net_val, self._net_card = self._make_card("NET INCOME")
         self._monthly_avg_val, self._monthly_avg_card = self._make_card("AVG MONTHLY NET")
+        self._net_state: str | None = None
 
         cards.addWidget(self._ytd_income_card)
         cards.addWidget(self._ytd_expense_card)
@@ -111,14 +126,18 @@ class DashboardWidget(QWidget):
         self.refresh()
 
     @staticmethod
-    def _make_card(label_text: str) -> tuple[QLabel, QFrame]:
+    def _make_card(
+        label_text: str, accent: str | None = None
+    ) -> tuple[QLabel, QFrame]:
         frame = QFrame()
         frame.setObjectName("statCard")
         vl = QVBoxLayout(frame)
         vl.setContentsMargins(10, 8, 10, 8)
         vl.setSpacing(4)
         val = QLabel("\u00a50")
-        val.setObjectName("statValue")
+        val.setObjectName(accent or "statValue")
+        # Values are always plain "¥n" text; skip the rich-text sniffing
+        val.setTextFormat(Qt.TextFormat.PlainText)
         val.setAlignment(Qt.AlignmentFlag.AlignCenter)
         lbl = QLabel(label_text)
         lbl.setObjectName("statLabel")
@@ -128,18 +147,16 @@ class DashboardWidget(QWidget):
         return val, frame
 
     def refresh(self) -> None:
+        # Runs on the debounce timer's timeout and once from __init__;
+        # stopping the timer keeps a direct call from being repeated
+        self._refresh_timer.stop()
         year = self._year_combo.currentData()
         if year is None:
             return
 
         # Monthly data
-        income_months: list[int] = []
-        expense_months: list[int] = []
-        labels: list[str] = []
-        for m in range(1, 13):
-            income_months.append(self._income_svc.monthly_total(year, m))
-            expense_months.append(self._expense_svc.monthly_total(year, m))
-            labels.append(f"{m}月")
+        income_months = self._income_svc.monthly_totals(year)
+        expense_months = self._expense_svc.monthly_totals(year)
 
         ytd_income = sum(income_months)
         ytd_expense = sum(expense_months)
@@ -151,18 +168,17 @@ class DashboardWidget(QWidget):
         avg_net = net // months_elapsed if months_elapsed else 0
 
         # Update stat cards
-        self._ytd_income_val.setText(f"\u00a5{ytd_income:,}")
-        self._ytd_income_val.setObjectName("accentGreen")
-        self._ytd_income_val.style().unpolish(self._ytd_income_val)
-        self._ytd_income_val.style().polish(self._ytd_income_val)
-
-        self._ytd_expense_val.setText(f"\u00a5{ytd_expense:,}")
-        self._ytd_expense_val.setObjectName("accentRed")
-        self._ytd_expense_val.style().unpolish(self._ytd_expense_val)
-        self._ytd_expense_val.style().polish(self._ytd_expense_val)
-
-        self._net_val.setText(f"\u00a5{net:,}")
-        self._monthly_avg_val.setText(f"\u00a5{avg_net:,}")
+        self._ytd_income_val.setText(format_yen(ytd_income))
+        self._ytd_expense_val.setText(format_yen(ytd_expense))
+        self._net_val.setText(format_yen(net))
+        # Only re-polish the net card when its sign actually flips
+        net_state = "negative" if net < 0 else "positive"
+        if net_state != self._net_state:
+            self._net_state = net_state
+            self._net_val.setProperty("state", net_state)
+            self._net_val.style().unpolish(self._net_val)
+            self._net_val.style().polish(self._net_val)
+        self._monthly_avg_val.setText(format_yen(avg_net))
 
         # Sparklines
         self._income_sparkline.set_data(income_months, T.INCOME_GREEN)
@@ -170,6 +186,6 @@ class DashboardWidget(QWidget):
 
         # Bar chart
         self._bar_chart.set_data(
-            labels, income_months, expense_months,
+            _MONTH_LABELS, income_months, expense_months,
             label_a="Income", label_b="Expenses",
         )
@@ -1,31 +1,229 @@
 """Bills & Expenses widget for the personal dashboard."""
 from __future__ import annotations
 
-from collections import defaultdict
+import sqlite3
+import threading
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QPushButton, QComboBox, QLabel, QMessageBox, QFileDialog,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QPushButton, QComboBox, QLabel, QMessageBox, QFileDialog,
     QHeaderView, QAbstractItemView, QMenu, QFrame)
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import (Qt, QDate, QAbstractTableModel, QModelIndex, QObject,
+    QRunnable, QThreadPool, QTimer, pyqtSignal)
 from PyQt6.QtGui import QAction
 
+from src.models.expense import EXPENSE_CATEGORY_LABELS, Expense, ExpenseCategory
+from src.repositories.expense_repo import ExpenseRepository
 from src.services.expense_service import ExpenseService
 from src.services.export_csv import export_expenses_csv
 from src.ui.dialogs.expense_dialog import ExpenseDialog
+from src.ui.formatting import format_yen
 from src.ui.widgets.charts import DonutChartWidget
 
 
 _COLUMNS = ["Date", "Amount (\u00a5)", "Category", "Payment Method", "Recurrence", "Notes"]
+# Initial pixel widths for every column but Notes, which stretches
+_COLUMN_WIDTHS = [110, 120, 220, 170, 130]
+# Rows handed to the view per fetchMore() call, so large year views only
+# materialise what has been scrolled into
+_FETCH_BATCH = 200
+# Amount column alignment, combined once rather than per data() call
+_AMOUNT_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+# Item roles resolved once; data() is called for every visible cell and role
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+
+class ExpenseTableModel(QAbstractTableModel):
+    """Read-only table model over a list of expenses.
+
+    Cell text is produced on demand in data(), so only the rows the view
+    actually paints are ever formatted.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[Expense] = []
+        # Rows exposed to the view so far; the rest arrive via fetchMore()
+        self._loaded = 0
 
+    def set_rows(self, rows: list[Expense]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), _FETCH_BATCH)
+        self.endResetModel()
 
-class ExpensesWidget(QWidget):
-    """Main widget for viewing and managing bills and expenses."""
+    def expense_id(self, row: int) -> int | None:
+        if 0 <= row < self._loaded:
+            return self._rows[row].id
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
 
-    def __init__(self, expense_service: ExpenseService, parent: QWidget | None = None) -> None:
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(_FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        expense = self._rows[index.row()]
+        col = index.column()
+        if role == _DISPLAY_ROLE:
+            if col == 0:
+                return expense.expense_date.isoformat()
+            if col == 1:
+                return format_yen(expense.amount)
+            if col == 2:
+                return EXPENSE_CATEGORY_LABELS[expense.category]
+            if col == 3:
+                return expense.payment_method.value
+            if col == 4:
+                return expense.recurrence.value
+            return expense.notes
+        if role == _ALIGNMENT_ROLE and col == 1:
+            return _AMOUNT_ALIGNMENT
+        if role == _USER_ROLE:
+            return expense.id
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (role == _DISPLAY_ROLE
+                and orientation == Qt.Orientation.Horizontal):
+            return _COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+
+# (rows, period total, per-category totals) for one year/month selection
+_PeriodData = tuple[list[Expense], int, dict[ExpenseCategory, int]]
+
+
+def _load_period(service: ExpenseService, year: int, month: int) -> _PeriodData:
+    """Fetch everything the widget shows for *year*/*month* (0 = whole year)."""
+    if month == 0:
+        expenses = service.get_yearly_expenses(year)
+        total = service.yearly_total(year)
+    else:
+        expenses = service.get_monthly_expenses(year, month)
+        total = service.monthly_total(year, month)
+    return expenses, total, service.category_totals(year, month or None)
+
+
+class _FetchSignals(QObject):
+    finished = pyqtSignal(int, int, int, object)  # generation, year, month, data
+    failed = pyqtSignal(int, str)  # generation, error message
+
+
+class _ThreadConnections:
+    """SQLite connections opened from *connect*, one per pool thread.
+
+    sqlite3 connections may not cross threads, but pool threads outlive
+    individual workers, so each thread opens its connection on first use
+    and reuses it for later refreshes.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection]) -> None:
+        self._connect = connect
+        self._conns: dict[int, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> sqlite3.Connection:
+        ident = threading.get_ident()
+        with self._lock:
+            conn = self._conns.get(ident)
+        if conn is None:
+            conn = self._connect()
+            with self._lock:
+                self._conns[ident] = conn
+        return conn
+
+
+class _FetchWorker(QRunnable):
+    """Runs _load_period on a pool thread over that thread's own connection."""
+
+    def __init__(
+        self,
+        generation: int,
+        connections: _ThreadConnections,
+        year: int,
+        month: int,
+    ) -> None:
+        super().__init__()
+        self.signals = _FetchSignals()
+        self._generation = generation
+        self._connections = connections
+        self._year = year
+        self._month = month
+
+    def run(self) -> None:
+        # An exception escaping run() aborts the whole process under PyQt6,
+        # so every failure is reported back to the GUI thread instead
+        try:
+            service = ExpenseService(ExpenseRepository(self._connections.get()))
+            data = _load_period(service, self._year, self._month)
+        except Exception as exc:
+            self.signals.failed.emit(self._generation, str(exc))
+            return
+        self.signals.finished.emit(self._generation, self._year, self._month, data)
+
+
+class ExpensesWidget(QWidget):
+    """Main widget for viewing and managing bills and expenses.
+
+    When *connect* is given, refreshes query the database on a background
+    thread through a connection it opens; otherwise they run synchronously
+    on *expense_service*. *connect* must open the same database each call,
+    so it can't be used with ":memory:".
+    """
+
+    def __init__(
+        self,
+        expense_service: ExpenseService,
+        parent: QWidget | None = None,
+        connect: Callable[[], sqlite3.Connection] | None = None,
+    ) -> None:
         super().__init__(parent)
         self._service = expense_service
+        self._connections = _ThreadConnections(connect) if connect else None
+        # One long-lived thread, so its connection is opened once and reused
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+        # Bumped per refresh; results from superseded background fetches
+        # are dropped
+        self._fetch_gen = 0
+        self._fetch_version = 0
+        self._pending_worker: _FetchWorker | None = None
+        # Rows currently displayed and the (year, month, service version)
+        # they were loaded for; export reuses them while still current
+        self._loaded_rows: list[Expense] = []
+        self._loaded_key: tuple[int, int, int] | None = None
+        # (year, month) shown by the last refresh; filter changes that land
+        # back on it are skipped
+        self._last_refresh_key: tuple[int, int] | None = None
+        # Coalesces year + month changes in one event-loop turn into a
+        # single refresh
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(0)
+        self._filter_timer.timeout.connect(self._on_filter_changed)
         self._build_ui()
         self._connect_signals()
         self.refresh_data()
@@ -87,16 +285,25 @@ class ExpensesWidget(QWidget):
         root_layout.addLayout(toolbar_layout)
 
         # --- Table ---
-        self._table = QTableWidget()
-        self._table.setColumnCount(len(_COLUMNS))
-        self._table.setHorizontalHeaderLabels(_COLUMNS)
+        self._model = ExpenseTableModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        # Fixed starting widths instead of ResizeToContents, which measured
+        # every row's text on each refresh; Notes takes the remaining space
         header = self._table.horizontalHeader()
         if header is not None:
             header.setStretchLastSection(True)
-            header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            for col, width in enumerate(_COLUMN_WIDTHS):
+                header.resizeSection(col, width)
+        # Fixed row heights so the view never measures rows individually
+        rows_header = self._table.verticalHeader()
+        if rows_header is not None:
+            rows_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            rows_header.setDefaultSectionSize(26)
         root_layout.addWidget(self._table)
 
         # --- Summary panel ---
@@ -136,8 +343,8 @@ class ExpensesWidget(QWidget):
     def _connect_signals(self) -> None:
         self._add_btn.clicked.connect(self._on_add)
         self._export_btn.clicked.connect(self._on_export)
-        self._year_combo.currentIndexChanged.connect(lambda _: self.refresh_data())
-        self._month_combo.currentIndexChanged.connect(lambda _: self.refresh_data())
+        self._year_combo.currentIndexChanged.connect(lambda _: self._filter_timer.start())
+        self._month_combo.currentIndexChanged.connect(lambda _: self._filter_timer.start())
         self._table.doubleClicked.connect(self._on_edit)
         self._table.customContextMenuRequested.connect(self._on_context_menu)
 
@@ -152,12 +359,10 @@ class ExpensesWidget(QWidget):
         """Return the selected month (1-12), or 0 for 'All'."""
         return self._month_combo.currentData()
 
-    def _fetch_expenses(self) -> list:
-        year = self._selected_year()
-        month = self._selected_month()
-        if month == 0:
-            return self._service.get_yearly_expenses(year)
-        return self._service.get_monthly_expenses(year, month)
+    def _on_filter_changed(self) -> None:
+        year, month = self._selected_year(), self._selected_month()
+        if (year, month) != self._last_refresh_key:
+            self._refresh(year, month)
 
     # ------------------------------------------------------------------
     # Public API
@@ -165,63 +370,78 @@ class ExpensesWidget(QWidget):
 
     def refresh_data(self) -> None:
         """Reload expenses from the service and repopulate all views."""
-        expenses = self._fetch_expenses()
-
-        # -- Populate table --
-        self._table.setRowCount(len(expenses))
-        for row, expense in enumerate(expenses):
-            # Date
-            date_item = QTableWidgetItem(expense.expense_date.isoformat())
-            date_item.setData(Qt.ItemDataRole.UserRole, expense.id)
-            self._table.setItem(row, 0, date_item)
-
-            # Amount
-            amount_item = QTableWidgetItem(f"\u00a5{expense.amount:,}")
-            amount_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self._table.setItem(row, 1, amount_item)
-
-            # Category
-            self._table.setItem(row, 2, QTableWidgetItem(expense.category_label))
-
-            # Payment method
-            self._table.setItem(row, 3, QTableWidgetItem(expense.payment_method.value))
-
-            # Recurrence
-            self._table.setItem(row, 4, QTableWidgetItem(expense.recurrence.value))
+        self._refresh(self._selected_year(), self._selected_month())
 
-            # Notes
-            self._table.setItem(row, 5, QTableWidgetItem(expense.notes))
+    def _refresh(self, year: int, month: int) -> None:
+        self._filter_timer.stop()
+        self._last_refresh_key = (year, month)
+        self._fetch_gen += 1
+        self._fetch_version = self._service.version
 
-        # -- Update stat cards --
-        total = sum(e.amount for e in expenses)
-        self._total_value_label.setText(f"\u00a5{total:,}")
-        self._count_value_label.setText(str(len(expenses)))
+        if self._connections is None:
+            self._apply_period(year, month, _load_period(self._service, year, month))
+            return
 
-        # -- Update donut chart with category breakdown --
-        category_totals: dict[str, int] = defaultdict(int)
-        for expense in expenses:
-            category_totals[expense.category_label] += expense.amount
-        chart_items = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
-        self._donut_chart.set_data(chart_items, center_label=f"\u00a5{total:,}")
+        worker = _FetchWorker(self._fetch_gen, self._connections, year, month)
+        worker.signals.finished.connect(self._on_fetch_finished)
+        worker.signals.failed.connect(self._on_fetch_failed)
+        self._pending_worker = worker
+        self._pool.start(worker)
+
+    def _on_fetch_finished(self, generation: int, year: int, month: int,
+                           data: _PeriodData) -> None:
+        if generation != self._fetch_gen:
+            return  # a newer refresh is already in flight
+        self._pending_worker = None
+        self._apply_period(year, month, data)
+
+    def _on_fetch_failed(self, generation: int, message: str) -> None:
+        if generation != self._fetch_gen:
+            return
+        self._pending_worker = None
+        # Forget the key so re-selecting the same period retries the load
+        self._last_refresh_key = None
+        QMessageBox.warning(self, "Load Error", f"Could not load expenses:\n{message}")
+
+    def _apply_period(self, year: int, month: int, data: _PeriodData) -> None:
+        expenses, total, category_totals = data
+        self._loaded_rows = expenses
+        self._loaded_key = (year, month, self._fetch_version)
+
+        # Suspend painting so the table, cards, donut and summary repaint
+        # together once instead of per update
+        self.setUpdatesEnabled(False)
+        try:
+            # -- Populate table --
+            self._model.set_rows(expenses)
+
+            # -- Update stat cards (totals are aggregated in SQL) --
+            self._total_value_label.setText(format_yen(total))
+            self._count_value_label.setText(str(len(expenses)))
+
+            # -- Update donut chart with category breakdown --
+            chart_items = sorted(
+                ((EXPENSE_CATEGORY_LABELS[cat], amount)
+                 for cat, amount in category_totals.items()),
+                key=lambda x: x[1], reverse=True,
+            )
+            self._donut_chart.set_data(chart_items, center_label=format_yen(total))
 
-        # -- Update summary --
-        self._update_summary(expenses)
+            # -- Update summary --
+            self._update_summary(year, month, total)
+        finally:
+            self.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
 
-    def _update_summary(self, expenses: list) -> None:
-        total = sum(e.amount for e in expenses)
-        month = self._selected_month()
-        year = self._selected_year()
+    def _update_summary(self, year: int, month: int, total: int) -> None:
         if month == 0:
             period = f"{year} Yearly"
         else:
             period = f"{year}/{month:02d} Monthly"
-        self._summary_label.setText(f"{period} Total: \u00a5{total:,}")
+        self._summary_label.setText(f"{period} Total: {format_yen(total)}")
 
     # ------------------------------------------------------------------
     # Slots
@@ -235,10 +455,7 @@ class ExpensesWidget(QWidget):
             self.refresh_data()
 
     def _on_edit(self) -> None:
-        row = self._table.currentRow()
-        if row < 0:
-            return
-        expense_id = self._table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        expense_id = self._model.expense_id(self._table.currentIndex().row())
         if expense_id is None:
             return
         expense = self._service.get_expense(expense_id)
@@ -252,10 +469,7 @@ class ExpensesWidget(QWidget):
             self.refresh_data()
 
     def _on_delete(self) -> None:
-        row = self._table.currentRow()
-        if row < 0:
-            return
-        expense_id = self._table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        expense_id = self._model.expense_id(self._table.currentIndex().row())
         if expense_id is None:
             return
 
@@ -271,8 +485,9 @@ class ExpensesWidget(QWidget):
             self.refresh_data()
 
     def _on_export(self) -> None:
-        default_name = f"expenses_{self._selected_year()}"
+        year = self._selected_year()
         month = self._selected_month()
+        default_name = f"expenses_{year}"
         if month != 0:
             default_name += f"_{month:02d}"
         default_name += ".csv"
@@ -286,12 +501,17 @@ class ExpensesWidget(QWidget):
         if not file_path:
             return
 
-        expenses = self._fetch_expenses()
+        if self._loaded_key == (year, month, self._service.version):
+            # Already on screen and unchanged since; rows are newest-first
+            expenses = reversed(self._loaded_rows)
+        elif month == 0:
+            expenses = self._service.iter_yearly_expenses(year)
+        else:
+            expenses = self._service.iter_monthly_expenses(year, month)
         export_expenses_csv(expenses, Path(file_path))
 
     def _on_context_menu(self, position) -> None:
-        item = self._table.itemAt(position)
-        if item is None:
+        if not self._table.indexAt(position).isValid():
             return
 
         menu = QMenu(self)
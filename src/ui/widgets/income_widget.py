@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -17,24 +17,111 @@ from PyQt6.QtWidgets import (
     QMenu,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from src.models.income import Income
 from src.services.export_csv import export_income_csv
 from src.services.income_service import IncomeService
 from src.ui.dialogs.income_dialog import IncomeDialog
+from src.ui.formatting import format_amount, format_yen
 from src.ui.theme import INCOME_GREEN
 from src.ui.widgets.charts import SparklineWidget
 
 
+_COLUMNS = ["Date", "Amount (\u00a5)", "Client", "Job Type", "Notes"]
+# Batch size for IncomeTableModel.fetchMore()
+_FETCH_BATCH = 200
+_AMOUNT_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+
+class IncomeTableModel(QAbstractTableModel):
+    """Read-only table model over a list of income entries.
+
+    Cell text is produced lazily in data() for the rows being painted.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[Income] = []
+        # How many of _rows the view currently knows about
+        self._loaded = 0
+
+    def set_rows(self, rows: list[Income]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), _FETCH_BATCH)
+        self.endResetModel()
+
+    def income_id(self, row: int) -> int | None:
+        if 0 <= row < self._loaded:
+            return self._rows[row].id
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(_FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(
+            QModelIndex(), self._loaded, self._loaded + count - 1
+        )
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        income = self._rows[index.row()]
+        col = index.column()
+        if role == _DISPLAY_ROLE:
+            if col == 0:
+                return income.income_date.isoformat()
+            if col == 1:
+                return format_amount(income.amount)
+            if col == 2:
+                return income.client
+            if col == 3:
+                return income.job_type.value
+            return income.notes
+        if role == _ALIGNMENT_ROLE and col == 1:
+            return _AMOUNT_ALIGNMENT
+        if role == _USER_ROLE:
+            return income.id
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if (
+            role == _DISPLAY_ROLE
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return _COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+
 class IncomeWidget(QWidget):
     """Main widget for the Income Tracking module."""
 
-    _COLUMNS = ["Date", "Amount (\u00a5)", "Client", "Job Type", "Notes"]
-
     def __init__(self, income_service: IncomeService, parent=None) -> None:
         super().__init__(parent)
         self._service = income_service
@@ -92,8 +179,9 @@ class IncomeWidget(QWidget):
         layout.addLayout(toolbar)
 
         # ---- table --------------------------------------------------------------
-        self._table = QTableWidget(0, len(self._COLUMNS))
-        self._table.setHorizontalHeaderLabels(self._COLUMNS)
+        self._model = IncomeTableModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -103,6 +191,11 @@ class IncomeWidget(QWidget):
         header = self._table.horizontalHeader()
         if header is not None:
             header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Fixed row heights so the view never measures rows individually
+        rows_header = self._table.verticalHeader()
+        if rows_header is not None:
+            rows_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            rows_header.setDefaultSectionSize(26)
 
         layout.addWidget(self._table)
 
@@ -165,22 +258,27 @@ class IncomeWidget(QWidget):
             incomes = self._service.get_monthly_incomes(year, month)
             total = self._service.monthly_total(year, month)
 
-        self._populate_table(incomes)
+        # update sparkline with monthly totals for the selected year
+        monthly_values = self._service.monthly_totals(year)
 
-        # update stat cards
-        self._update_stat_card(self._gross_card, f"\u00a5{total:,}")
-        self._update_stat_card(self._entries_card, str(len(incomes)))
+        # Apply everything with painting suspended so the table, cards and
+        # sparkline repaint together once
+        self.setUpdatesEnabled(False)
+        try:
+            self._model.set_rows(incomes)
 
-        # Mark the gross income value with the accent-green object name
-        gross_value_label = self._gross_card.findChild(QLabel, "statValue")
-        if gross_value_label is not None:
-            gross_value_label.setObjectName("accentGreen")
+            # update stat cards
+            self._update_stat_card(self._gross_card, format_yen(total))
+            self._update_stat_card(self._entries_card, str(len(incomes)))
 
-        # update sparkline with monthly totals for the selected year
-        monthly_values = [
-            self._service.monthly_total(year, m) for m in range(1, 13)
-        ]
-        self._sparkline.set_data(monthly_values, INCOME_GREEN)
+            # Mark the gross income value with the accent-green object name
+            gross_value_label = self._gross_card.findChild(QLabel, "statValue")
+            if gross_value_label is not None:
+                gross_value_label.setObjectName("accentGreen")
+
+            self._sparkline.set_data(monthly_values, INCOME_GREEN)
+        finally:
+            self.setUpdatesEnabled(True)
 
     @staticmethod
     def _update_stat_card(card: QFrame, value: str) -> None:
@@ -189,26 +287,6 @@ class IncomeWidget(QWidget):
         if labels:
             labels[0].setText(value)
 
-    def _populate_table(self, incomes) -> None:
-        self._table.setRowCount(0)
-        for income in incomes:
-            row = self._table.rowCount()
-            self._table.insertRow(row)
-
-            date_item = QTableWidgetItem(income.income_date.isoformat())
-            date_item.setData(Qt.ItemDataRole.UserRole, income.id)
-            self._table.setItem(row, 0, date_item)
-
-            amount_item = QTableWidgetItem(f"{income.amount:,}")
-            amount_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self._table.setItem(row, 1, amount_item)
-
-            self._table.setItem(row, 2, QTableWidgetItem(income.client))
-            self._table.setItem(row, 3, QTableWidgetItem(income.job_type.value))
-            self._table.setItem(row, 4, QTableWidgetItem(income.notes))
-
     # ------------------------------------------------------------------
     # Add / Edit / Delete
     # ------------------------------------------------------------------
@@ -222,10 +300,9 @@ class IncomeWidget(QWidget):
             self.refresh_data()
 
     def _on_edit(self) -> None:
-        row = self._table.currentRow()
-        if row < 0:
+        income_id = self._model.income_id(self._table.currentIndex().row())
+        if income_id is None:
             return
-        income_id = self._table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         income = self._service.get_income(income_id)
         if income is None:
             return
@@ -238,10 +315,9 @@ class IncomeWidget(QWidget):
             self.refresh_data()
 
     def _on_delete(self) -> None:
-        row = self._table.currentRow()
-        if row < 0:
+        income_id = self._model.income_id(self._table.currentIndex().row())
+        if income_id is None:
             return
-        income_id = self._table.item(row, 0).data(Qt.ItemDataRole.UserRole)
 
         reply = QMessageBox.question(
             self,
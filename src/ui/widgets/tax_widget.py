@@ -10,7 +10,7 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
 from PyQt6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -20,31 +20,87 @@ from PyQt6.QtWidgets import (
     QLabel,
     QListWidget,
     QPushButton,
+    QAbstractItemView,
     QScrollArea,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from src.models.tax import CategoryBreakdown
 from src.services.export_csv import export_tax_summary_csv
 from src.services.expense_service import ExpenseService
 from src.services.income_service import IncomeService
 from src.services.tax_service import TaxService
+from src.ui.formatting import format_yen
 from src.ui.widgets.charts import BarChartWidget, DonutChartWidget
 
-_MONTH_LABELS = [
+_MONTH_LABELS: tuple[str, ...] = (
     "1月", "2月", "3月", "4月", "5月", "6月",
     "7月", "8月", "9月", "10月", "11月", "12月",
-]
+)
 
-_CHECKLIST_ITEMS = [
+_CHECKLIST_ITEMS: tuple[str, ...] = (
     "収支内訳書を準備 (Prepare income/expense statement)",
     "源泉徴収票を確認 (Verify withholding tax slips)",
     "経費の領収書を整理 (Organize expense receipts)",
     "申告期限: 3月15日 (Filing deadline: March 15)",
     "e-Tax または税務署で提出 (Submit via e-Tax or tax office)",
-]
+)
+
+
+_BREAKDOWN_HEADERS = ("カテゴリ (Category)", "金額 (Amount ¥)")
+_AMOUNT_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class _ExpenseBreakdownModel(QAbstractTableModel):
+    """Two-column (category, amount) model for the expense breakdown table.
+
+    Rows are formatted once in set_breakdown(); data() only indexes them.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._breakdown: tuple[CategoryBreakdown, ...] = ()
+        self._rows: tuple[tuple[str, str], ...] = ()
+
+    def set_breakdown(self, breakdown: tuple[CategoryBreakdown, ...]) -> None:
+        if breakdown is self._breakdown:
+            return
+        self.beginResetModel()
+        self._breakdown = breakdown
+        self._rows = tuple(
+            (item.category_label, format_yen(item.total)) for item in breakdown
+        )
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 1:
+            return _AMOUNT_ALIGNMENT
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return _BREAKDOWN_HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class TaxWidget(QWidget):
@@ -62,9 +118,18 @@ class TaxWidget(QWidget):
         self._income_service = income_service
         self._expense_service = expense_service
         self._summary = None
+        self._rendered_summary = None
+        self._loaded = False
 
+        # The first load waits until the tab is shown (see showEvent), so
+        # constructing the main window doesn't pay for tax aggregation
         self._init_ui()
-        self.refresh_data()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            QTimer.singleShot(0, self.refresh_data)
 
     # ------------------------------------------------------------------
     # UI construction
@@ -181,6 +246,7 @@ class TaxWidget(QWidget):
         value_label.setObjectName("statValue")
         if accent:
             value_label.setObjectName(accent)
+        value_label.setTextFormat(Qt.TextFormat.PlainText)
         value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         card_layout.addWidget(value_label)
 
@@ -207,17 +273,22 @@ class TaxWidget(QWidget):
 
     # ---- Expense breakdown table ----
 
-    @staticmethod
-    def _build_table() -> QTableWidget:
-        table = QTableWidget(0, 2)
-        table.setHorizontalHeaderLabels(["カテゴリ (Category)", "金額 (Amount ¥)"])
+    def _build_table(self) -> QTableView:
+        # One model per year, so flipping back to a year already shown is
+        # a setModel() rather than a rebuild
+        self._breakdown_models: dict[int, _ExpenseBreakdownModel] = {}
+        self._breakdown_model = _ExpenseBreakdownModel(self)
+        table = QTableView()
+        table.setModel(self._breakdown_model)
         table.horizontalHeader().setStretchLastSection(True)
         table.horizontalHeader().setSectionResizeMode(
             0, QHeaderView.ResizeMode.Stretch
         )
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.verticalHeader().setVisible(False)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.verticalHeader().setDefaultSectionSize(26)
         return table
 
     # ---- Checklist ----
@@ -232,8 +303,7 @@ class TaxWidget(QWidget):
         layout.addWidget(header)
 
         checklist = QListWidget()
-        for item_text in _CHECKLIST_ITEMS:
-            checklist.addItem(item_text)
+        checklist.addItems(_CHECKLIST_ITEMS)
         layout.addWidget(checklist)
 
         return container
@@ -248,17 +318,28 @@ class TaxWidget(QWidget):
         if year is None:
             return
 
+        self._loaded = True
         self._summary = self._tax_service.get_tax_summary(year)
+        # Nothing to redraw if the tab already shows this exact summary
+        if self._summary == self._rendered_summary:
+            return
+        self._rendered_summary = self._summary
 
         has_data = (
             self._summary.gross_income != 0
             or self._summary.total_expenses != 0
         )
 
-        if has_data:
-            self._show_data()
-        else:
-            self._show_empty_state(year)
+        # Cards, charts and table all change here; hold painting until
+        # they are consistent so the tab repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            if has_data:
+                self._show_data()
+            else:
+                self._show_empty_state(year)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _show_data(self) -> None:
         """Populate all sections with current data."""
@@ -268,44 +349,32 @@ class TaxWidget(QWidget):
         summary = self._summary
 
         # -- Stat card values --
-        self._gross_value.setText(f"¥{summary.gross_income:,}")
-        self._expense_value.setText(f"¥{summary.total_expenses:,}")
-        self._net_value.setText(f"¥{summary.net_income:,}")
+        self._gross_value.setText(format_yen(summary.gross_income))
+        self._expense_value.setText(format_yen(summary.total_expenses))
+        self._net_value.setText(format_yen(summary.net_income))
 
         # -- Donut chart: expense category breakdown --
-        donut_items = [
-            (item.category_label, item.total)
-            for item in summary.expense_breakdown
-        ]
-        self._donut_chart.set_data(donut_items, center_label="経費内訳")
+        self._donut_chart.set_data(summary.chart_items, center_label="経費内訳")
 
         # -- Bar chart: monthly income vs expenses --
         year = summary.year
-        monthly_income = [
-            self._income_service.monthly_total(year, m) for m in range(1, 13)
-        ]
-        monthly_expense = [
-            self._expense_service.monthly_total(year, m) for m in range(1, 13)
-        ]
         self._bar_chart.set_data(
-            labels=list(_MONTH_LABELS),
-            series_a=monthly_income,
-            series_b=monthly_expense,
+            labels=_MONTH_LABELS,
+            series_a=summary.monthly_income,
+            series_b=summary.monthly_expenses,
             label_a="収入 (Income)",
             label_b="経費 (Expenses)",
         )
 
         # -- Expense breakdown table --
-        breakdown = summary.expense_breakdown
-        self._table.setRowCount(len(breakdown))
-        for row, item in enumerate(breakdown):
-            category_item = QTableWidgetItem(item.category_label)
-            amount_item = QTableWidgetItem(f"¥{item.total:,}")
-            amount_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self._table.setItem(row, 0, category_item)
-            self._table.setItem(row, 1, amount_item)
+        model = self._breakdown_models.get(year)
+        if model is None:
+            model = _ExpenseBreakdownModel(self)
+            self._breakdown_models[year] = model
+        model.set_breakdown(summary.expense_breakdown)
+        if model is not self._breakdown_model:
+            self._breakdown_model = model
+            self._table.setModel(model)
 
     def _show_empty_state(self, year: int) -> None:
         """Show an informative message when no data exists for the year."""
@@ -0,0 +1,43 @@
+"""Shared pytest fixtures."""
+import sqlite3
+
+import pytest
+
+from src.repositories.database import init_db
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    """In-memory database with the schema applied, built once per session."""
+    conn = sqlite3.connect(":memory:")
+    init_db(conn)
+    yield conn
+    conn.close()
+
+
+def _clone(template: sqlite3.Connection) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+@pytest.fixture()
+def conn(schema_template):
+    """Fresh in-memory database per test, copied from the schema template.
+
+    The repositories commit after every write, so tests can't share one
+    connection and roll back; copying the template's pages is much cheaper
+    than replaying the DDL.
+    """
+    conn = _clone(schema_template)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def module_conn(schema_template):
+    """Like ``conn`` but shared by a whole module, for read-only datasets."""
+    conn = _clone(schema_template)
+    yield conn
+    conn.close()
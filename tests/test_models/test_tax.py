@@ -43,6 +43,19 @@ class TestTaxSummary:
         except AttributeError:
             pass
 
+    def test_chart_items(self):
+        summary = TaxSummary(
+            year=2025,
+            gross_income=100,
+            total_expenses=80,
+            expense_breakdown=(
+                CategoryBreakdown("rent", "Rent", 50),
+                CategoryBreakdown("dining", "Dining", 30),
+            ),
+        )
+        assert summary.chart_items == (("Rent", 50), ("Dining", 30))
+        assert summary.chart_items is summary.chart_items
+
 
 class TestCategoryBreakdown:
     def test_creation(self):
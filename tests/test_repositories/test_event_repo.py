@@ -1,19 +1,14 @@
 """Tests for EventRepository using an in-memory SQLite database."""
-import sqlite3
 from datetime import date, time
 
 import pytest
 
 from src.models.event import Event, EventCategory, EventRecurrence
-from src.repositories.database import init_db
 from src.repositories.event_repo import EventRepository
 
 
 @pytest.fixture()
-def repo():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    init_db(conn)
+def repo(conn):
     return EventRepository(conn)
 
 
@@ -69,24 +64,47 @@ class TestDelete:
         assert repo.get_by_id(e.id) is None
 
 
+_QUERY_DATES = (
+    date(2025, 5, 1),
+    date(2025, 5, 10),
+    date(2025, 5, 20),
+    date(2025, 5, 20),
+    date(2025, 5, 21),
+    date(2025, 5, 31),
+    date(2025, 6, 1),
+    date(2025, 11, 30),
+    date(2025, 12, 31),
+    date(2026, 1, 1),
+)
+
+
+@pytest.fixture(scope="module")
+def query_repo(module_conn):
+    repo = EventRepository(module_conn)
+    for d in _QUERY_DATES:
+        repo.insert(_sample_event(event_date=d, title=d.isoformat()))
+    return repo
+
+
 class TestQueries:
-    def test_get_by_date(self, repo):
-        repo.insert(_sample_event(event_date=date(2025, 5, 20)))
-        repo.insert(_sample_event(event_date=date(2025, 5, 20), title="Second"))
-        repo.insert(_sample_event(event_date=date(2025, 5, 21), title="Other day"))
-        results = repo.get_by_date(date(2025, 5, 20))
-        assert len(results) == 2
-
-    def test_get_by_month(self, repo):
-        repo.insert(_sample_event(event_date=date(2025, 5, 1)))
-        repo.insert(_sample_event(event_date=date(2025, 5, 31), title="End"))
-        repo.insert(_sample_event(event_date=date(2025, 6, 1), title="June"))
-        assert len(repo.get_by_month(2025, 5)) == 2
-
-    def test_get_by_date_range(self, repo):
-        repo.insert(_sample_event(event_date=date(2025, 5, 10), title="A"))
-        repo.insert(_sample_event(event_date=date(2025, 5, 20), title="B"))
-        repo.insert(_sample_event(event_date=date(2025, 5, 30), title="C"))
-        results = repo.get_by_date_range(date(2025, 5, 15), date(2025, 5, 25))
-        assert len(results) == 1
-        assert results[0].title == "B"
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ("get_by_date", (date(2025, 5, 20),), ["2025-05-20"] * 2),
+            (
+                "get_by_month",
+                (2025, 5),
+                ["2025-05-01", "2025-05-10", "2025-05-20", "2025-05-20",
+                 "2025-05-21", "2025-05-31"],
+            ),
+            ("get_by_month", (2025, 12), ["2025-12-31"]),
+            (
+                "get_by_date_range",
+                (date(2025, 5, 15), date(2025, 5, 25)),
+                ["2025-05-20", "2025-05-20", "2025-05-21"],
+            ),
+        ],
+    )
+    def test_query(self, query_repo, method, args, expected):
+        results = getattr(query_repo, method)(*args)
+        assert [e.title for e in results] == expected
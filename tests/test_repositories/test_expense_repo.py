@@ -1,19 +1,14 @@
 """Tests for ExpenseRepository using an in-memory SQLite database."""
-import sqlite3
 from datetime import date
 
 import pytest
 
 from src.models.expense import Expense, ExpenseCategory, PaymentMethod, RecurrenceType
-from src.repositories.database import init_db
 from src.repositories.expense_repo import ExpenseRepository
 
 
 @pytest.fixture()
-def repo():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    init_db(conn)
+def repo(conn):
     return ExpenseRepository(conn)
 
 
@@ -39,6 +34,10 @@ class TestInsert:
         all_expenses = repo.get_all()
         assert len(all_expenses) == 1
 
+    def test_insert_many(self, repo):
+        repo.insert_many([_sample_expense(amount=1), _sample_expense(amount=2)])
+        assert sorted(e.amount for e in repo.get_all()) == [1, 2]
+
 
 class TestUpdate:
     def test_updates_fields(self, repo):
@@ -66,27 +65,75 @@ class TestDelete:
         assert repo.get_by_id(e.id) is None
 
 
+_QUERY_DATES = (
+    date(2024, 12, 31),
+    date(2025, 3, 1),
+    date(2025, 3, 15),
+    date(2025, 3, 31),
+    date(2025, 4, 1),
+    date(2025, 12, 31),
+)
+
+
+@pytest.fixture(scope="module")
+def query_repo(module_conn):
+    repo = ExpenseRepository(module_conn)
+    repo.insert_many(_sample_expense(expense_date=d) for d in _QUERY_DATES)
+    return repo
+
+
 class TestQueries:
-    def test_get_by_month(self, repo):
-        repo.insert(_sample_expense(expense_date=date(2025, 3, 1)))
-        repo.insert(_sample_expense(expense_date=date(2025, 3, 31)))
-        repo.insert(_sample_expense(expense_date=date(2025, 4, 1)))
-        results = repo.get_by_month(2025, 3)
-        assert len(results) == 2
-
-    def test_get_by_year(self, repo):
-        repo.insert(_sample_expense(expense_date=date(2025, 1, 1)))
-        repo.insert(_sample_expense(expense_date=date(2025, 12, 31)))
-        repo.insert(_sample_expense(expense_date=date(2024, 12, 31)))
-        results = repo.get_by_year(2025)
-        assert len(results) == 2
-
-    def test_get_by_date_range(self, repo):
-        repo.insert(_sample_expense(expense_date=date(2025, 3, 1)))
-        repo.insert(_sample_expense(expense_date=date(2025, 3, 15)))
-        repo.insert(_sample_expense(expense_date=date(2025, 3, 31)))
-        results = repo.get_by_date_range(date(2025, 3, 5), date(2025, 3, 20))
-        assert len(results) == 1
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ("get_by_month", (2025, 3), 3),
+            ("get_by_month", (2025, 12), 1),
+            ("get_by_year", (2025,), 5),
+            ("get_by_date_range", (date(2025, 3, 5), date(2025, 3, 20)), 1),
+        ],
+    )
+    def test_query(self, query_repo, method, args, expected):
+        assert len(getattr(query_repo, method)(*args)) == expected
 
     def test_get_by_id_nonexistent(self, repo):
         assert repo.get_by_id(999) is None
+
+
+class TestAggregates:
+    def test_get_total_for_month_and_year(self, repo):
+        repo.insert(_sample_expense(amount=1000, expense_date=date(2025, 3, 1)))
+        repo.insert(_sample_expense(amount=2000, expense_date=date(2025, 4, 1)))
+        repo.insert(_sample_expense(amount=4000, expense_date=date(2024, 3, 1)))
+        assert repo.get_total(2025, 3) == 1000
+        assert repo.get_total(2025) == 3000
+
+    def test_get_total_empty_is_zero(self, repo):
+        assert repo.get_total(2025) == 0
+        assert repo.get_total(2025, 1) == 0
+
+    def test_get_category_totals_scoped_to_month(self, repo):
+        repo.insert(_sample_expense(
+            amount=1000, category=ExpenseCategory.RENT,
+            expense_date=date(2025, 3, 1),
+        ))
+        repo.insert(_sample_expense(
+            amount=500, category=ExpenseCategory.GROCERIES,
+            expense_date=date(2025, 3, 2),
+        ))
+        repo.insert(_sample_expense(
+            amount=700, category=ExpenseCategory.GROCERIES,
+            expense_date=date(2025, 4, 2),
+        ))
+        assert repo.get_category_totals(2025, 3) == {
+            ExpenseCategory.RENT: 1000,
+            ExpenseCategory.GROCERIES: 500,
+        }
+        assert repo.get_category_totals(2025)[ExpenseCategory.GROCERIES] == 1200
+
+    def test_iter_by_period_is_ascending_and_scoped(self, repo):
+        repo.insert(_sample_expense(expense_date=date(2025, 3, 20)))
+        repo.insert(_sample_expense(expense_date=date(2025, 3, 5)))
+        repo.insert(_sample_expense(expense_date=date(2025, 4, 1)))
+        dates = [e.expense_date for e in repo.iter_by_period(2025, 3)]
+        assert dates == [date(2025, 3, 5), date(2025, 3, 20)]
+        assert len(list(repo.iter_by_period(2025))) == 3
@@ -1,19 +1,14 @@
 """Tests for IncomeRepository using an in-memory SQLite database."""
-import sqlite3
 from datetime import date
 
 import pytest
 
 from src.models.income import Income, JobType
-from src.repositories.database import init_db
 from src.repositories.income_repo import IncomeRepository
 
 
 @pytest.fixture()
-def repo():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    init_db(conn)
+def repo(conn):
     return IncomeRepository(conn)
 
 
@@ -38,6 +33,10 @@ class TestInsert:
         repo.insert(_sample_income())
         assert len(repo.get_all()) == 1
 
+    def test_insert_many(self, repo):
+        repo.insert_many([_sample_income(amount=1), _sample_income(amount=2)])
+        assert sorted(i.amount for i in repo.get_all()) == [1, 2]
+
 
 class TestUpdate:
     def test_updates_fields(self, repo):
@@ -66,21 +65,39 @@ class TestDelete:
         assert repo.get_by_id(i.id) is None
 
 
-class TestQueries:
-    def test_get_by_month(self, repo):
-        repo.insert(_sample_income(income_date=date(2025, 6, 1)))
-        repo.insert(_sample_income(income_date=date(2025, 6, 30)))
-        repo.insert(_sample_income(income_date=date(2025, 7, 1)))
-        assert len(repo.get_by_month(2025, 6)) == 2
+_QUERY_DATES = (
+    date(2024, 12, 31),
+    date(2025, 1, 1),
+    date(2025, 6, 1),
+    date(2025, 6, 30),
+    date(2025, 7, 1),
+)
+
+
+@pytest.fixture(scope="module")
+def query_repo(module_conn):
+    repo = IncomeRepository(module_conn)
+    repo.insert_many(_sample_income(income_date=d) for d in _QUERY_DATES)
+    return repo
 
-    def test_get_by_year(self, repo):
-        repo.insert(_sample_income(income_date=date(2025, 1, 1)))
-        repo.insert(_sample_income(income_date=date(2024, 12, 31)))
-        assert len(repo.get_by_year(2025)) == 1
+
+class TestQueries:
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ("get_by_month", (2025, 6), 2),
+            ("get_by_year", (2025,), 4),
+            ("get_by_year", (2024,), 1),
+        ],
+    )
+    def test_query(self, query_repo, method, args, expected):
+        assert len(getattr(query_repo, method)(*args)) == expected
 
     def test_get_distinct_clients(self, repo):
-        repo.insert(_sample_income(client="Alpha"))
-        repo.insert(_sample_income(client="Beta"))
-        repo.insert(_sample_income(client="Alpha"))
+        repo.insert_many([
+            _sample_income(client="Alpha"),
+            _sample_income(client="Beta"),
+            _sample_income(client="Alpha"),
+        ])
         clients = repo.get_distinct_clients()
         assert clients == ["Alpha", "Beta"]
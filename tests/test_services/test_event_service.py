@@ -0,0 +1,45 @@
+"""Tests for EventService."""
+from datetime import date
+
+import pytest
+
+from src.models.event import Event, EventCategory
+from src.repositories.event_repo import EventRepository
+from src.services.event_service import EventService
+
+
+@pytest.fixture()
+def service(conn):
+    repo = EventRepository(conn)
+    return EventService(repo)
+
+
+def _event(**overrides) -> Event:
+    defaults = dict(
+        title="Meeting",
+        event_date=date(2025, 6, 15),
+        category=EventCategory.WORK,
+    )
+    defaults.update(overrides)
+    return Event(**defaults)
+
+
+class TestVersion:
+    def test_starts_at_zero(self, service):
+        assert service.version == 0
+
+    def test_bumped_by_each_mutation(self, service):
+        ev = service.add_event(_event())
+        assert service.version == 1
+        ev.title = "Renamed"
+        service.update_event(ev)
+        assert service.version == 2
+        service.delete_event(ev.id)
+        assert service.version == 3
+
+    def test_reads_do_not_bump(self, service):
+        service.add_event(_event())
+        service.get_events_for_month(2025, 6)
+        service.get_events_for_date(date(2025, 6, 15))
+        service.get_all_events()
+        assert service.version == 1
@@ -1,20 +1,15 @@
 """Tests for ExpenseService."""
-import sqlite3
 from datetime import date
 
 import pytest
 
 from src.models.expense import Expense, ExpenseCategory, PaymentMethod
-from src.repositories.database import init_db
 from src.repositories.expense_repo import ExpenseRepository
 from src.services.expense_service import ExpenseService
 
 
 @pytest.fixture()
-def service():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    init_db(conn)
+def service(conn):
     repo = ExpenseRepository(conn)
     return ExpenseService(repo)
 
@@ -32,20 +27,40 @@ def _expense(**overrides) -> Expense:
 
 class TestMonthlyTotal:
     def test_sums_correct_month(self, service):
-        service.add_expense(_expense(amount=1000, expense_date=date(2025, 3, 1)))
-        service.add_expense(_expense(amount=2000, expense_date=date(2025, 3, 15)))
-        service.add_expense(_expense(amount=9999, expense_date=date(2025, 4, 1)))
+        service.add_expenses([
+            _expense(amount=1000, expense_date=date(2025, 3, 1)),
+            _expense(amount=2000, expense_date=date(2025, 3, 15)),
+            _expense(amount=9999, expense_date=date(2025, 4, 1)),
+        ])
         assert service.monthly_total(2025, 3) == 3000
 
     def test_empty_month_returns_zero(self, service):
         assert service.monthly_total(2025, 1) == 0
 
 
+class TestMonthlyTotals:
+    def test_one_entry_per_month(self, service):
+        service.add_expense(_expense(amount=1000, expense_date=date(2025, 3, 1)))
+        service.add_expense(_expense(amount=2000, expense_date=date(2025, 3, 15)))
+        service.add_expense(_expense(amount=500, expense_date=date(2025, 12, 31)))
+        service.add_expense(_expense(amount=9999, expense_date=date(2024, 3, 1)))
+        totals = service.monthly_totals(2025)
+        assert len(totals) == 12
+        assert totals[2] == 3000
+        assert totals[11] == 500
+        assert sum(totals) == 3500
+
+    def test_empty_year_is_all_zero(self, service):
+        assert service.monthly_totals(2025) == [0] * 12
+
+
 class TestYearlyTotal:
     def test_sums_correct_year(self, service):
-        service.add_expense(_expense(amount=1000, expense_date=date(2025, 1, 1)))
-        service.add_expense(_expense(amount=2000, expense_date=date(2025, 12, 31)))
-        service.add_expense(_expense(amount=5000, expense_date=date(2024, 6, 1)))
+        service.add_expenses([
+            _expense(amount=1000, expense_date=date(2025, 1, 1)),
+            _expense(amount=2000, expense_date=date(2025, 12, 31)),
+            _expense(amount=5000, expense_date=date(2024, 6, 1)),
+        ])
         assert service.yearly_total(2025) == 3000
 
 
@@ -67,3 +82,21 @@ class TestCategoryTotals:
         assert totals[ExpenseCategory.RENT] == 100_000
         assert totals[ExpenseCategory.GROCERIES] == 8_000
         assert ExpenseCategory.DINING not in totals
+
+
+class TestVersion:
+    def test_bumped_by_mutations_only(self, service):
+        assert service.version == 0
+        e = service.add_expense(_expense())
+        service.monthly_total(2025, 3)
+        service.get_yearly_expenses(2025)
+        assert service.version == 1
+        e.amount = 6000
+        service.update_expense(e)
+        service.delete_expense(e.id)
+        assert service.version == 3
+
+    def test_bulk_add_bumps_once(self, service):
+        service.add_expenses([_expense(), _expense()])
+        assert service.version == 1
+        assert len(service.get_yearly_expenses(2025)) == 2
@@ -1,8 +1,7 @@
 """Tests for CSV export functions."""
 import csv
-import tempfile
+import io
 from datetime import date
-from pathlib import Path
 
 from src.models.expense import Expense, ExpenseCategory, PaymentMethod
 from src.models.income import Income, JobType
@@ -14,21 +13,30 @@ from src.services.export_csv import (
 )
 
 
-class TestExportTaxSummaryCSV:
-    def test_creates_valid_csv(self, tmp_path):
-        summary = TaxSummary(
-            year=2025,
-            gross_income=5_000_000,
-            total_expenses=1_200_000,
-            expense_breakdown=(
-                CategoryBreakdown("rent", "Rent", 800_000),
-                CategoryBreakdown("utilities", "Utilities", 400_000),
-            ),
-        )
-        out = tmp_path / "summary.csv"
-        export_tax_summary_csv(summary, out)
+def _export_to_text(export, data) -> str:
+    """Run an exporter against a StringIO and return the text after the BOM."""
+    buf = io.StringIO()
+    export(data, buf)
+    content = buf.getvalue()
+    assert content.startswith("\ufeff")
+    return content[1:]
+
+
+def _summary() -> TaxSummary:
+    return TaxSummary(
+        year=2025,
+        gross_income=5_000_000,
+        total_expenses=1_200_000,
+        expense_breakdown=(
+            CategoryBreakdown("rent", "Rent", 800_000),
+            CategoryBreakdown("utilities", "Utilities", 400_000),
+        ),
+    )
 
-        content = out.read_text(encoding="utf-8-sig")
+
+class TestExportTaxSummaryCSV:
+    def test_creates_valid_csv(self):
+        content = _export_to_text(export_tax_summary_csv, _summary())
         assert "2025" in content
         assert "5,000,000" in content
         assert "1,200,000" in content
@@ -36,37 +44,63 @@ class TestExportTaxSummaryCSV:
         assert "Rent" in content
         assert "確定申告" in content
 
+    def test_writes_path_with_bom(self, tmp_path):
+        out = tmp_path / "summary.csv"
+        export_tax_summary_csv(_summary(), out)
+
+        raw = out.read_bytes()
+        assert raw.startswith(b"\xef\xbb\xbf")
+        assert "確定申告" in raw.decode("utf-8-sig")
+
 
 class TestExportIncomeCSV:
-    def test_creates_valid_csv(self, tmp_path):
+    def test_creates_valid_csv(self):
         incomes = [
             Income(amount=100_000, income_date=date(2025, 3, 1),
                    client="Alpha", job_type=JobType.CONTRACT),
             Income(amount=200_000, income_date=date(2025, 1, 15),
                    client="Beta", job_type=JobType.HOURLY),
         ]
-        out = tmp_path / "income.csv"
-        export_income_csv(incomes, out)
-
-        content = out.read_text(encoding="utf-8-sig")
-        lines = content.strip().split("\n")
-        assert len(lines) == 3  # header + 2 rows
+        content = _export_to_text(export_income_csv, incomes)
+        assert content.count("\n") == 3  # header + 2 rows
         # Should be sorted by date (Jan before Mar)
-        assert "2025-01-15" in lines[1]
-        assert "2025-03-01" in lines[2]
+        assert content.index("2025-01-15") < content.index("2025-03-01")
 
 
 class TestExportExpensesCSV:
-    def test_creates_valid_csv(self, tmp_path):
+    def test_creates_valid_csv(self):
         expenses = [
             Expense(amount=5_000, category=ExpenseCategory.GROCERIES,
                     expense_date=date(2025, 4, 10),
                     payment_method=PaymentMethod.CASH),
         ]
-        out = tmp_path / "expenses.csv"
-        export_expenses_csv(expenses, out)
+        content = _export_to_text(export_expenses_csv, expenses)
+        assert content.count("\n") == 2  # header + 1 row
+        assert "groceries" in content
+
+    def test_streams_from_iterator_in_given_order(self):
+        def gen():
+            for day in (1, 2, 3):
+                yield Expense(amount=day * 1000,
+                              category=ExpenseCategory.RENT,
+                              expense_date=date(2025, 4, day),
+                              payment_method=PaymentMethod.CASH)
+
+        content = _export_to_text(export_expenses_csv, gen())
+        assert content.count("\n") == 4
+        assert (
+            content.index("2025-04-01")
+            < content.index("2025-04-02")
+            < content.index("2025-04-03")
+        )
 
-        content = out.read_text(encoding="utf-8-sig")
-        lines = content.strip().split("\n")
-        assert len(lines) == 2  # header + 1 row
-        assert "groceries" in lines[1]
+    def test_escapes_formula_like_notes(self):
+        expenses = [
+            Expense(amount=5_000, category=ExpenseCategory.OTHER,
+                    expense_date=date(2025, 4, 10),
+                    payment_method=PaymentMethod.CASH,
+                    notes="=HYPERLINK(\"http://x\")"),
+        ]
+        content = _export_to_text(export_expenses_csv, expenses)
+        rows = list(csv.reader(io.StringIO(content)))
+        assert rows[1][5] == "'=HYPERLINK(\"http://x\")"
@@ -1,20 +1,15 @@
 """Tests for IncomeService."""
-import sqlite3
 from datetime import date
 
 import pytest
 
 from src.models.income import Income, JobType
-from src.repositories.database import init_db
 from src.repositories.income_repo import IncomeRepository
 from src.services.income_service import IncomeService
 
 
 @pytest.fixture()
-def service():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    init_db(conn)
+def service(conn):
     repo = IncomeRepository(conn)
     return IncomeService(repo)
 
@@ -32,21 +27,38 @@ def _income(**overrides) -> Income:
 
 class TestMonthlyTotal:
     def test_sums_correct_month(self, service):
-        service.add_income(_income(amount=100_000, income_date=date(2025, 6, 1)))
-        service.add_income(_income(amount=200_000, income_date=date(2025, 6, 30)))
-        service.add_income(_income(amount=999_999, income_date=date(2025, 7, 1)))
+        service.add_incomes([
+            _income(amount=100_000, income_date=date(2025, 6, 1)),
+            _income(amount=200_000, income_date=date(2025, 6, 30)),
+            _income(amount=999_999, income_date=date(2025, 7, 1)),
+        ])
         assert service.monthly_total(2025, 6) == 300_000
 
 
+class TestMonthlyTotals:
+    def test_matches_monthly_total(self, service):
+        service.add_income(_income(amount=100_000, income_date=date(2025, 1, 1)))
+        service.add_income(_income(amount=200_000, income_date=date(2025, 6, 30)))
+        service.add_income(_income(amount=999_999, income_date=date(2024, 6, 1)))
+        totals = service.monthly_totals(2025)
+        assert totals == [service.monthly_total(2025, m) for m in range(1, 13)]
+        assert totals[0] == 100_000
+        assert totals[5] == 200_000
+
+
 class TestYearlyTotal:
     def test_sums_correct_year(self, service):
-        service.add_income(_income(amount=100_000, income_date=date(2025, 1, 1)))
-        service.add_income(_income(amount=200_000, income_date=date(2025, 12, 31)))
+        service.add_incomes([
+            _income(amount=100_000, income_date=date(2025, 1, 1)),
+            _income(amount=200_000, income_date=date(2025, 12, 31)),
+        ])
         assert service.yearly_total(2025) == 300_000
 
     def test_excludes_other_years(self, service):
-        service.add_income(_income(amount=100_000, income_date=date(2024, 12, 31)))
-        service.add_income(_income(amount=200_000, income_date=date(2025, 1, 1)))
+        service.add_incomes([
+            _income(amount=100_000, income_date=date(2024, 12, 31)),
+            _income(amount=200_000, income_date=date(2025, 1, 1)),
+        ])
         assert service.yearly_total(2025) == 200_000
 
 
@@ -56,3 +68,39 @@ class TestDistinctClients:
         service.add_income(_income(client="Alpha"))
         service.add_income(_income(client="Bravo"))
         assert service.get_distinct_clients() == ["Alpha", "Bravo"]
+
+    def test_tracks_adds_after_first_load(self, service):
+        service.add_income(_income(client="Bravo"))
+        assert service.get_distinct_clients() == ["Bravo"]
+        service.add_income(_income(client="Alpha"))
+        assert service.get_distinct_clients() == ["Alpha", "Bravo"]
+
+    def test_tracks_bulk_adds_after_first_load(self, service):
+        service.add_income(_income(client="Bravo"))
+        assert service.get_distinct_clients() == ["Bravo"]
+        service.add_incomes([_income(client="Alpha"), _income(client="Charlie")])
+        assert service.get_distinct_clients() == ["Alpha", "Bravo", "Charlie"]
+        assert service.version == 2
+
+    def test_reflects_update_and_delete(self, service):
+        inc = service.add_income(_income(client="Bravo"))
+        other = service.add_income(_income(client="Alpha"))
+        assert service.get_distinct_clients() == ["Alpha", "Bravo"]
+        inc.client = "Charlie"
+        service.update_income(inc)
+        assert service.get_distinct_clients() == ["Alpha", "Charlie"]
+        service.delete_income(other.id)
+        assert service.get_distinct_clients() == ["Charlie"]
+
+
+class TestVersion:
+    def test_bumped_by_mutations_only(self, service):
+        assert service.version == 0
+        inc = service.add_income(_income())
+        service.monthly_total(2025, 3)
+        service.get_distinct_clients()
+        assert service.version == 1
+        inc.amount = 60_000
+        service.update_income(inc)
+        service.delete_income(inc.id)
+        assert service.version == 3
@@ -1,12 +1,10 @@
 """Tests for TaxService."""
-import sqlite3
 from datetime import date
 
 import pytest
 
 from src.models.expense import Expense, ExpenseCategory, PaymentMethod
 from src.models.income import Income, JobType
-from src.repositories.database import init_db
 from src.repositories.expense_repo import ExpenseRepository
 from src.repositories.income_repo import IncomeRepository
 from src.services.expense_service import ExpenseService
@@ -15,10 +13,7 @@ from src.services.tax_service import TaxService
 
 
 @pytest.fixture()
-def tax_service():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    init_db(conn)
+def tax_service(conn):
     expense_repo = ExpenseRepository(conn)
     income_repo = IncomeRepository(conn)
     expense_svc = ExpenseService(expense_repo)
@@ -75,6 +70,12 @@ class TestGetTaxSummary:
         assert summary.expense_breakdown[0].total == 100_000
         assert summary.expense_breakdown[1].total == 20_000
 
+        assert summary.monthly_income[2] == 500_000
+        assert summary.monthly_income[5] == 300_000
+        assert sum(summary.monthly_income) == 800_000
+        assert summary.monthly_expenses[:2] == (100_000, 20_000)
+        assert len(summary.monthly_expenses) == 12
+
     def test_ignores_other_years(self, tax_service):
         svc, income_svc, expense_svc = tax_service
 
@@ -93,3 +94,35 @@ class TestGetTaxSummary:
 
         summary = svc.get_tax_summary(2025)
         assert summary.gross_income == 200_000
+
+
+class TestSummaryCache:
+    def test_repeated_calls_return_cached_summary(self, tax_service):
+        svc, _, _ = tax_service
+        assert svc.get_tax_summary(2025) is svc.get_tax_summary(2025)
+
+    def test_writes_invalidate(self, tax_service):
+        svc, income_svc, expense_svc = tax_service
+        assert svc.get_tax_summary(2025).gross_income == 0
+
+        inc = income_svc.add_income(Income(
+            amount=100_000,
+            income_date=date(2025, 4, 1),
+            client="Client A",
+            job_type=JobType.CONTRACT,
+        ))
+        assert svc.get_tax_summary(2025).gross_income == 100_000
+
+        exp = expense_svc.add_expense(Expense(
+            amount=30_000,
+            category=ExpenseCategory.RENT,
+            expense_date=date(2025, 4, 1),
+            payment_method=PaymentMethod.CASH,
+        ))
+        assert svc.get_tax_summary(2025).total_expenses == 30_000
+
+        income_svc.delete_income(inc.id)
+        expense_svc.delete_expense(exp.id)
+        summary = svc.get_tax_summary(2025)
+        assert summary.gross_income == 0
+        assert summary.total_expenses == 0
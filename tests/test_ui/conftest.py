@@ -0,0 +1,13 @@
+"""Fixtures for widget tests, run against Qt's offscreen platform."""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,77 @@
+"""Tests for ExpensesWidget's background loading."""
+import sqlite3
+from datetime import date
+from functools import partial
+from unittest import mock
+
+import pytest
+
+from src.models.expense import Expense, ExpenseCategory, PaymentMethod
+from src.repositories.database import get_connection, init_db
+from src.repositories.expense_repo import ExpenseRepository
+from src.services.expense_service import ExpenseService
+from src.ui.widgets.expenses_widget import ExpensesWidget
+
+_YEAR = date.today().year
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    path = tmp_path / "dashboard.db"
+    conn = get_connection(path)
+    init_db(conn)
+    service = ExpenseService(ExpenseRepository(conn))
+    service.add_expenses(
+        Expense(
+            amount=1000 * month,
+            category=ExpenseCategory.GROCERIES,
+            expense_date=date(_YEAR, month, 10),
+            payment_method=PaymentMethod.CASH,
+        )
+        for month in (1, 2, 2, 3)
+    )
+    yield path, service
+    conn.close()
+
+
+def _wait(app, widget) -> None:
+    widget._pool.waitForDone()
+    app.processEvents()
+
+
+class TestBackgroundLoad:
+    def test_applies_rows_when_fetch_finishes(self, qapp, db_path):
+        path, service = db_path
+        widget = ExpensesWidget(service, connect=partial(get_connection, path))
+        _wait(qapp, widget)
+        assert widget._model.rowCount() == 4
+        assert widget._total_value_label.text() == "¥8,000"
+
+    def test_only_latest_generation_is_applied(self, qapp, db_path):
+        path, service = db_path
+        widget = ExpensesWidget(service, connect=partial(get_connection, path))
+        _wait(qapp, widget)
+        with mock.patch.object(
+            widget, "_apply_period", wraps=widget._apply_period
+        ) as apply:
+            widget._refresh(_YEAR, 1)
+            widget._refresh(_YEAR, 2)
+            _wait(qapp, widget)
+        assert apply.call_count == 1
+        assert apply.call_args.args[:2] == (_YEAR, 2)
+        assert widget._model.rowCount() == 2
+
+    def test_failure_is_reported_on_gui_thread(self, qapp, db_path):
+        _, service = db_path
+
+        def connect():
+            raise sqlite3.OperationalError("database is locked")
+
+        with mock.patch(
+            "src.ui.widgets.expenses_widget.QMessageBox.warning"
+        ) as warning:
+            widget = ExpensesWidget(service, connect=connect)
+            _wait(qapp, widget)
+        assert warning.call_count == 1
+        assert "database is locked" in warning.call_args.args[2]
+        assert widget._pending_worker is None